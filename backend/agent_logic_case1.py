@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-from typing import Dict, Any, Optional, List, Tuple
-from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple, Iterable
+from dataclasses import dataclass, replace
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from itertools import islice
+from functools import lru_cache
+from contextlib import suppress
 import os
 import time
 import sys
 import json
 import re
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # -----------------------------
 # Path safety
@@ -27,123 +34,239 @@ from backend.config import (
     CASE2_ENABLED as CASE2_ENABLED_DEFAULT,
     CASE2_MAX_LEADERS as CASE2_MAX_LEADERS_DEFAULT,
     CASE2_TIMEOUT_SECS,
+    CASE2_TOTAL_TIMEOUT_SECS,
+    CASE2_MAX_WORKERS,
+    RAW_JSON_PRETTY,
+    DEBUG_MODE,
 )
 
 import backend.scraper as scraper
 import backend.miner as miner
 import backend.excel_utils as excel_utils
 
+# -----------------------------
+# Case-2 settings (read once at import)
+# -----------------------------
+@dataclass(frozen=True)
+class _Case2Settings:
+    enabled: bool
+    max_leaders: int
+    timeout_secs: int  # per-request timeout (email fallback)
+    total_timeout_secs: int  # global guard for the whole Case-2 phase
+
+
+def _load_case2_settings() -> _Case2Settings:
+    try:
+        max_leaders = int(CASE2_MAX_LEADERS_DEFAULT or 5)
+    except Exception:
+        max_leaders = 5
+    try:
+        total_timeout = int(CASE2_TOTAL_TIMEOUT_SECS or 600)
+    except Exception:
+        total_timeout = 600
+    return _Case2Settings(
+        enabled=bool(CASE2_ENABLED_DEFAULT),
+        max_leaders=max(1, min(max_leaders, 5)),
+        timeout_secs=int(CASE2_TIMEOUT_SECS or 10),
+        total_timeout_secs=max(1, total_timeout),
+    )
+
+
+_CASE2_SETTINGS = _load_case2_settings()
+
+# Output folder is created once at import (not on every pipeline call)
+OUTPUT_DIR = os.path.join("data", "output")
+with suppress(OSError):
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+# Optional fast JSON for the raw dump fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 # -----------------------------
 # Case-2 modules - With Debug
 # -----------------------------
 scraper_case2 = None
 SCRAPER_CASE2_AVAILABLE = False
 
+# Import-time status lines follow the same DEBUG_MODE switch as the pipeline
 try:
-    print("🔧 Loading scraper_case2...")
+    if DEBUG_MODE:
+        print("🔧 Loading scraper_case2...")
     import backend.scraper_case2 as scraper_case2
     SCRAPER_CASE2_AVAILABLE = True
-    print("✅ scraper_case2 loaded successfully!")
+    if DEBUG_MODE:
+        print("✅ scraper_case2 loaded successfully!")
 except ImportError as e:
-    print(f"❌ scraper_case2 import failed: {e}")
+    if DEBUG_MODE:
+        print(f"❌ scraper_case2 import failed: {e}")
 except Exception as e:
-    print(f"❌ scraper_case2 error: {e}")
+    if DEBUG_MODE:
+        print(f"❌ scraper_case2 error: {e}")
+
+# -----------------------------
+# Case-2 cross-run cache (SQLite, 72h TTL)
+# -----------------------------
+db = None
+DB_AVAILABLE = False
+
+try:
+    import backend.db as db
+    DB_AVAILABLE = True
+except Exception as e:
+    if DEBUG_MODE:
+        print(f"⚠️ db unavailable, Case-2 cache disabled: {e}")
 
 
 # -----------------------------
 # Helpers
 # -----------------------------
 def _safe_top_n(top_n: Any, default: int, cap: int) -> int:
-    try:
-        n = int(top_n)
-    except Exception:
+    if isinstance(top_n, int):
+        n = top_n  # common case (UI passes int): no conversion, no handler
+    else:
         n = default
+        with suppress(TypeError, ValueError):
+            n = int(top_n)
     if n <= 0:
         n = default
     return max(1, min(n, cap))
 
 
-def _read_bytes(path: str) -> bytes | None:
-    try:
-        if path and os.path.exists(path):
-            with open(path, "rb") as f:
-                return f.read()
-    except Exception:
-        return None
-    return None
-
-
-def _clean_url(u: str) -> str:
+@lru_cache(maxsize=4096)
+def _clean_url_and_key(u: str) -> Tuple[str, str]:
+    """
+    One normalization pass -> (clean url, lowercase dedupe key).
+    Both are ("", "") when there is nothing to scrape.
+    Pure string -> tuple, so repeat URLs (chains, re-runs) are memoized.
+    """
     u = (u or "").strip()
     lu = u.lower()
     if not u or "googleusercontent.com" in lu or "google.com/url" in lu:
-        return ""
+        return "", ""
     if u.startswith(("mailto:", "tel:", "javascript:")):
-        return ""
+        return "", ""
     if u.startswith("www."):
-        u = "https://" + u
-    if not (u.startswith("http://") or u.startswith("https://")):
-        u = "https://" + u
-    return u
+        u, lu = "https://" + u, "https://" + lu
+    if not u.startswith(("http://", "https://")):
+        u, lu = "https://" + u, "https://" + lu
+    return u, lu
+
+
+def _clean_url(u: str) -> str:
+    return _clean_url_and_key(u)[0]
+
+
+# -----------------------------
+# Shared HTTP session (keep-alive + pooled connections)
+# -----------------------------
+# Case-2 is network-bound; run companies concurrently (bounded by config)
+try:
+    _CASE2_MAX_WORKERS = max(1, int(CASE2_MAX_WORKERS or 16))
+except Exception:
+    _CASE2_MAX_WORKERS = 16
+
+
+def _build_session(pool_connections: int, pool_maxsize: int) -> requests.Session:
+    session = requests.Session()
+    # Default headers set once (per-request headers still override, e.g. UA rotation)
+    session.headers.update({"User-Agent": "Mozilla/5.0"})
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,  # distinct hosts kept warm
+        pool_maxsize=pool_maxsize,  # sockets per host
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Each worker can have a crawl + an email fetch in flight, so size for 2x workers;
+# then no thread ever waits on (or discards) a pooled socket.
+_SESSION = _build_session(
+    pool_connections=max(50, _CASE2_MAX_WORKERS),
+    pool_maxsize=max(100, 2 * _CASE2_MAX_WORKERS),
+)
 
 
 # -----------------------------
 # Email helpers
 # -----------------------------
-_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
-_FREE_EMAIL_DOMAINS = {
+# Bytes pattern: runs on the raw response body (no full-page decode); ASCII-only by design
+_EMAIL_RE = re.compile(rb"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
+# Contact emails sit in the header/footer; no need to pull (or regex) a 10MB page
+_EMAIL_MAX_BYTES = 256 * 1024
+_EMAIL_CHUNK_BYTES = 64 * 1024
+_FREE_EMAIL_DOMAINS = frozenset(map(sys.intern, (
     "gmail.com", "yahoo.com", "outlook.com", "hotmail.com", "live.com",
     "icloud.com", "aol.com", "proton.me", "protonmail.com", "zoho.com",
-}
+)))
 _PREFERRED_PREFIX = (
     "info@", "contact@", "admin@", "office@", "support@", "help@",
     "admissions@", "enquiry@", "inquiry@",
 )
+# Local part -> priority (lower wins); one dict hit replaces the prefix scan
+_PREFIX_RANK: Dict[str, int] = {p[:-1]: i for i, p in enumerate(_PREFERRED_PREFIX)}
 
 
-def _pick_best_email_from_html(html: str) -> str:
+def _pick_best_email_from_html(html: str | bytes) -> str:
     if not html:
         return ""
-    emails = [e.lower() for e in _EMAIL_RE.findall(html)]
-    if not emails:
-        return ""
-
-    filtered: List[str] = []
-    for e in emails:
-        try:
-            dom = e.split("@", 1)[1].strip().lower()
-        except Exception:
-            continue
+    if isinstance(html, str):
+        html = html.encode("utf-8", "ignore")
+
+    # Single pass: drop free-mail domains and keep the best-priority prefix.
+    # Ties keep the earliest match; with no preferred prefix, the first kept email wins.
+    first = ""
+    best = ""
+    best_rank = len(_PREFERRED_PREFIX)
+    for raw in _EMAIL_RE.findall(html):
+        # Only the (small) matches are decoded + lowercased
+        e = raw.decode("ascii").lower()
+        # Regex guarantees one "@" and no whitespace
+        local, _, dom = e.partition("@")
         if dom in _FREE_EMAIL_DOMAINS:
             continue
-        filtered.append(e)
-
-    if not filtered:
-        return ""
-
-    for p in _PREFERRED_PREFIX:
-        for e in filtered:
-            if e.startswith(p):
-                return e
+        if not first:
+            first = e
+        rank = _PREFIX_RANK.get(local, best_rank)
+        if rank < best_rank:
+            best, best_rank = e, rank
+            if rank == 0:
+                break
 
-    return filtered[0]
+    return best or first
 
 
 def _scrape_contact_email_light(website: str, timeout: int) -> str:
     if not website:
         return ""
     try:
-        r = requests.get(
+        r = _SESSION.get(
             website,
-            headers={"User-Agent": "Mozilla/5.0"},
             timeout=max(6, int(timeout or 10)),
             allow_redirects=True,
+            stream=True,
         )
+    except Exception:
+        return ""
+    try:
         if r.status_code >= 400:
             return ""
-        return _pick_best_email_from_html(r.text or "")
-    except Exception:
+        body = bytearray()
+        for chunk in r.iter_content(_EMAIL_CHUNK_BYTES):
+            body += chunk
+            if len(body) >= _EMAIL_MAX_BYTES:
+                break
+        return _pick_best_email_from_html(bytes(body[:_EMAIL_MAX_BYTES]))
+    except (requests.RequestException, UnicodeError):
         return ""
+    finally:
+        r.close()
 
 
 # -----------------------------
@@ -158,11 +281,85 @@ BUCKETS = [
 ]
 
 
+# Built once; callers get a per-bucket copy (cheaper than deepcopy, same isolation)
+_EMPTY_MGMT_TEMPLATE: Dict[str, Dict[str, str]] = {
+    b: {"name": "", "designation": ""} for b in BUCKETS
+}
+_EMPTY_MGMT_ITEMS = tuple(_EMPTY_MGMT_TEMPLATE.items())
+
+
 def _empty_case2_management() -> Dict[str, Dict[str, str]]:
-    return {b: {"name": "", "designation": ""} for b in BUCKETS}
+    return {b: cell.copy() for b, cell in _EMPTY_MGMT_ITEMS}
+
+
+# Baseline keys every exported row must carry (built once, not per row)
+_ROW_DEFAULTS: Dict[str, str] = {
+    "Leadership Found": "No",
+    "Company Name": "Unknown",
+    "Website URL": "",
+    "Contact Email": "",
+    "Contact Phone": "",
+    "Address": "",
+}
+_ROW_DEFAULT_ITEMS = tuple(_ROW_DEFAULTS.items())
+
+
+def _apply_row_defaults(row: Dict[str, Any]) -> None:
+    """Fill missing baseline keys in one pass; mgmt dict is only built if absent."""
+    for k, v in _ROW_DEFAULT_ITEMS:
+        if k not in row:
+            row[k] = v
+    if "case2_management" not in row:
+        row["case2_management"] = _empty_case2_management()
+
+
+# ✅ IMPROVED: Role mapping rules with CRO (built once at import)
+_BUCKET_RULES: Dict[str, List[str]] = {
+    "Executive Leadership": [
+        "ceo", "chief executive", "founder", "co-founder", "cofounder",
+        "managing director", "chairman", "chairperson", "president", 
+        "director", "md", "executive director", "principal", "partner",
+        "owner", "proprietor", "executive vice president", "evp"
+    ],
+    "Technology / Operations": [
+        "cto", "cio", "coo", "chief technology", "chief information",
+        "chief operating", "technology", "operations", "technical",
+        "engineering", "it head", "head of technology", "head of operations"
+    ],
+    "Finance / Administration": [
+        "cfo", "chief financial", "finance", "accounts", "admin",
+        "administration", "hr", "human resources", "controller",
+        "treasurer", "head of finance", "head of hr"
+    ],
+    "Business Development / Growth": [
+        "cro", "chief revenue officer", "chief revenue",  # ✅ ADDED CRO
+        "business development", "sales", "growth", "revenue", 
+        "commercial", "bd", "strategy", "head of sales", "head of bd"
+    ],
+    "Marketing / Branding": [
+        "cmo", "chief marketing", "marketing", "brand", 
+        "communications", "pr", "digital", "head of marketing"
+    ],
+}
 
+# One compiled alternation per bucket: a single C-level scan answers
+# "is ANY keyword a substring of the role?" (same semantics as the keyword loop)
+_BUCKET_PATTERNS: List[Tuple[str, "re.Pattern[str]"]] = [
+    (bucket, re.compile("|".join(re.escape(k) for k in keywords)))
+    for bucket, keywords in _BUCKET_RULES.items()
+]
+
+# Flat keyword -> bucket ordinals for the common case where the whole role IS a
+# keyword ("ceo", "director", "cfo"...). Each entry lists, in priority order,
+# every bucket whose patterns hit that string, so skip-if-filled still works.
+_KEYWORD_TO_BUCKETS: Dict[str, Tuple[int, ...]] = {
+    kw: tuple(i for i, (_, pattern) in enumerate(_BUCKET_PATTERNS) if pattern.search(kw))
+    for keywords in _BUCKET_RULES.values()
+    for kw in keywords
+}
 
-def _normalize_case2_leaders_to_buckets(leaders_list: List[Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
+
+def _normalize_case2_leaders_to_buckets(leaders_list: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
     """
     ✅ FIXED: Convert flat leaders list from scraper_case2 into bucketed format
     - Added CRO mapping
@@ -170,35 +367,10 @@ def _normalize_case2_leaders_to_buckets(leaders_list: List[Dict[str, Any]]) -> D
     - Handles missing designation gracefully
     """
     out = _empty_case2_management()
-    
-    # ✅ IMPROVED: Role mapping rules with CRO
-    bucket_rules = {
-        "Executive Leadership": [
-            "ceo", "chief executive", "founder", "co-founder", "cofounder",
-            "managing director", "chairman", "chairperson", "president", 
-            "director", "md", "executive director", "principal", "partner",
-            "owner", "proprietor", "executive vice president", "evp"
-        ],
-        "Technology / Operations": [
-            "cto", "cio", "coo", "chief technology", "chief information",
-            "chief operating", "technology", "operations", "technical",
-            "engineering", "it head", "head of technology", "head of operations"
-        ],
-        "Finance / Administration": [
-            "cfo", "chief financial", "finance", "accounts", "admin",
-            "administration", "hr", "human resources", "controller",
-            "treasurer", "head of finance", "head of hr"
-        ],
-        "Business Development / Growth": [
-            "cro", "chief revenue officer", "chief revenue",  # ✅ ADDED CRO
-            "business development", "sales", "growth", "revenue", 
-            "commercial", "bd", "strategy", "head of sales", "head of bd"
-        ],
-        "Marketing / Branding": [
-            "cmo", "chief marketing", "marketing", "brand", 
-            "communications", "pr", "digital", "head of marketing"
-        ],
-    }
+    any_filled = False  # running flag instead of re-scanning all buckets per leader
+    # Filled flags by bucket ordinal (_BUCKET_PATTERNS order): a list index per
+    # check instead of two dict lookups into out[bucket]["name"]
+    filled = [False] * len(_BUCKET_PATTERNS)
     
     for leader in leaders_list:
         if not isinstance(leader, dict):
@@ -211,30 +383,38 @@ def _normalize_case2_leaders_to_buckets(leaders_list: List[Dict[str, Any]]) -> D
         if not name:
             continue
         
-        role_lower = role.lower() if role else ""
+        role_lower = role.lower()
         
         # Find matching bucket
         matched = False
-        for bucket, keywords in bucket_rules.items():
-            if out[bucket]["name"]:  # Skip if bucket already filled
-                continue
-            
-            # ✅ Better matching: check if ANY keyword is in role
-            if role_lower:
-                for keyword in keywords:
-                    if keyword in role_lower:
-                        out[bucket]["name"] = name
-                        out[bucket]["designation"] = role
-                        matched = True
-                        break
-            
-            if matched:
-                break
+        exact = _KEYWORD_TO_BUCKETS.get(role_lower)
+        if exact is not None:
+            # Fast path: role is exactly a keyword -> dict lookup, no scanning
+            for i in exact:
+                if not filled[i]:
+                    cell = out[_BUCKET_PATTERNS[i][0]]
+                    cell["name"] = name
+                    cell["designation"] = role
+                    filled[i] = matched = any_filled = True
+                    break
+        elif role_lower:
+            for i, (bucket, pattern) in enumerate(_BUCKET_PATTERNS):
+                if filled[i]:  # Skip if bucket already filled
+                    continue
+                
+                # ✅ Better matching: check if ANY keyword is in role
+                if pattern.search(role_lower):
+                    cell = out[bucket]
+                    cell["name"] = name
+                    cell["designation"] = role
+                    filled[i] = matched = any_filled = True
+                    break
         
         # ✅ If no match but have name+role, put in Executive (fallback)
-        if not matched and role and not any(out[b]["name"] for b in BUCKETS):
+        if not matched and role and not any_filled:
             out["Executive Leadership"]["name"] = name
             out["Executive Leadership"]["designation"] = role
+            filled[0] = any_filled = True
     
     return out
 
@@ -247,10 +427,11 @@ def _has_leadership_strict(mgmt: Dict[str, Dict[str, str]]) -> bool:
     if not isinstance(mgmt, dict):
         return False
     
+    # Names are stripped once at ingress (_normalize_case2_leaders_to_buckets),
+    # so a non-empty name in any bucket = success
     for bucket in BUCKETS:
-        d = mgmt.get(bucket) or {}
-        name = (d.get("name") or "").strip()
-        if name:  # Name exists in any bucket = success
+        d = mgmt.get(bucket)
+        if d and d.get("name"):
             return True
     
     return False
@@ -264,7 +445,8 @@ def _apply_case2_management_to_row(
     """Apply Case-2 management data to row"""
     row["case2_management"] = mgmt
     row["Leadership Found"] = "Yes" if _has_leadership_strict(mgmt) else "No"
-    if email and not (row.get("Contact Email") or "").strip():
+    # Miner already whitespace-normalizes "Contact Email"; no re-strip needed
+    if email and not row.get("Contact Email"):
         row["Contact Email"] = email
 
 
@@ -310,8 +492,17 @@ def _scrape_case1_safe(
     os.makedirs(raw_dir, exist_ok=True)
     out_path = os.path.join(raw_dir, f"raw_{run_id}.json")
     try:
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        # Compact unless RAW_JSON_PRETTY (raw file is machine-read)
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if RAW_JSON_PRETTY else 0)
+            with open(out_path, "wb", buffering=1 << 20) as f:
+                f.write(orjson.dumps(results, option=option))
+        else:
+            with open(out_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                if RAW_JSON_PRETTY:
+                    json.dump(results, f, ensure_ascii=False, indent=2)
+                else:
+                    json.dump(results, f, ensure_ascii=False, separators=(",", ":"))
     except Exception:
         pass
 
@@ -321,6 +512,51 @@ def _scrape_case1_safe(
 # -----------------------------
 # 🔥 Case-2 enrichment wrapper
 # -----------------------------
+class _NoLeaders(Exception):
+    """Empty scrape result; raised so lru_cache never stores it (may be transient)."""
+
+
+@lru_cache(maxsize=1024)
+def _enrich_with_case2_cached(
+    website: str,
+    max_leaders: int,
+) -> Tuple[Tuple[str, str, str], ...]:
+    """
+    In-process memo of a successful leadership scrape (chains, franchises,
+    repeat queries in the same session). Returns frozen (bucket, name,
+    designation) rows since dicts can't be shared safely out of a cache.
+    """
+    result = scraper_case2.scrape_company_leadership(
+        company_url=website,
+        respect_robots=False,
+        save_to_db=False,
+        session=_SESSION,
+    )
+    
+    if not result or not result.get("success"):
+        raise _NoLeaders()
+    
+    # Extract leaders
+    all_leaders = result.get("all_leaders", [])
+    
+    if not all_leaders:
+        raise _NoLeaders()
+    
+    # Convert to dict format (lazily: no slice copy, no intermediate list;
+    # the normalizer walks it exactly once)
+    leaders_dicts = (
+        {"name": leader.get("name", ""), "role": leader.get("role", "")}
+        for leader in islice(all_leaders, max_leaders)
+        if isinstance(leader, dict)
+    )
+    
+    # ✅ Map to buckets with improved logic
+    mgmt = _normalize_case2_leaders_to_buckets(leaders_dicts)
+    if not _has_leadership_strict(mgmt):
+        raise _NoLeaders()
+    return tuple((b, mgmt[b]["name"], mgmt[b]["designation"]) for b in BUCKETS)
+
+
 def _enrich_with_case2(
     company_name: str,
     website: str,
@@ -332,45 +568,129 @@ def _enrich_with_case2(
     
     Returns: (management_dict, email)
     """
-    mgmt = _empty_case2_management()
     email = ""
+    website = _clean_url(website)
     
     if not SCRAPER_CASE2_AVAILABLE or not scraper_case2 or not website:
-        return mgmt, email
+        return _empty_case2_management(), email
     
     try:
-        # Call scraper_case2
-        result = scraper_case2.scrape_company_leadership(
-            company_url=website,
-            respect_robots=False,
-            save_to_db=False,
-        )
-        
-        if not result or not result.get("success"):
-            return mgmt, email
-        
-        # Extract leaders
-        all_leaders = result.get("all_leaders", [])
-        
-        if not all_leaders:
-            return mgmt, email
-        
-        # Convert to dict format
-        leaders_dicts = []
-        for leader in all_leaders[:max_leaders]:
-            if isinstance(leader, dict):
-                leaders_dicts.append({
-                    "name": leader.get("name", ""),
-                    "role": leader.get("role", ""),
-                })
-        
-        # ✅ Map to buckets with improved logic
-        mgmt = _normalize_case2_leaders_to_buckets(leaders_dicts)
-        
+        frozen = _enrich_with_case2_cached(website, max_leaders)
+    except _NoLeaders:
+        return _empty_case2_management(), email
     except Exception as e:
         # ✅ Silent fail but log error
         print(f"      ⚠️ Case-2 error for {company_name}: {str(e)[:100]}")
+        return _empty_case2_management(), email
     
+    # Fresh dicts per caller (rows own and may mutate their management)
+    return {b: {"name": n, "designation": d} for b, n, d in frozen}, email
+
+
+_CASE2_CACHE_LOCK = threading.Lock()
+_CASE2_CACHE_READY = False
+
+
+def _case2_cache_ready() -> bool:
+    """Create cache tables once per process (lazy, thread-safe)."""
+    global _CASE2_CACHE_READY
+    if not DB_AVAILABLE:
+        return False
+    if _CASE2_CACHE_READY:
+        return True
+    with _CASE2_CACHE_LOCK:
+        if not _CASE2_CACHE_READY:
+            try:
+                db.init_db()
+                _CASE2_CACHE_READY = True
+            except Exception as e:
+                print(f"⚠️ Case-2 cache init failed: {str(e)[:100]}")
+    return _CASE2_CACHE_READY
+
+
+def _case2_cache_key(website: str, max_leaders: int) -> str:
+    # The leader cap shapes the result, so it is part of the key (like the in-process memo)
+    return f"{db.make_case2_cache_key(website_url=website)}:max_leaders={max_leaders}"
+
+
+def _case2_cache_get(website: str, max_leaders: int) -> Optional[Dict[str, Dict[str, str]]]:
+    if not _case2_cache_ready():
+        return None
+    try:
+        payload = db.get_case2_cache(_case2_cache_key(website, max_leaders))
+    except Exception:
+        return None
+    if not payload or not isinstance(payload.get("case2_management"), dict):
+        return None
+    mgmt = _empty_case2_management()
+    for b in BUCKETS:
+        cell = payload["case2_management"].get(b) or {}
+        mgmt[b] = {
+            "name": str(cell.get("name") or ""),
+            "designation": str(cell.get("designation") or ""),
+        }
+    return mgmt
+
+
+def _case2_cache_set(website: str, max_leaders: int, mgmt: Dict[str, Dict[str, str]]) -> None:
+    # Only cache hits; an empty result may just be a transient block/timeout.
+    # Management only: an email depends on the row that asked (it may have had one).
+    if not _has_leadership_strict(mgmt) or not _case2_cache_ready():
+        return
+    try:
+        db.save_case2_cache(
+            _case2_cache_key(website, max_leaders),
+            {"case2_management": mgmt},
+        )
+    except Exception as e:
+        print(f"⚠️ Case-2 cache write failed: {str(e)[:100]}")
+
+
+# Homepage email fetches get their own pool so they overlap with the (much
+# slower) leadership crawl instead of queueing behind it in the same worker.
+_EMAIL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_CASE2_MAX_WORKERS, thread_name_prefix="case2-email"
+)
+
+
+def _run_case2_job(
+    company_name: str,
+    website: str,
+    max_leaders: int,
+    has_email: bool,
+    email_timeout: int,
+) -> Tuple[Dict[str, Dict[str, str]], str]:
+    """
+    One Case-2 unit of work (runs in a worker thread).
+    Cache lookup, then leadership scrape + fallback email scrape (both in flight
+    together); never touches the row itself. A cache hit still fetches the
+    fallback email when the row has none (only management is cached).
+    """
+    email_future = None
+    if not has_email:
+        email_future = _EMAIL_EXECUTOR.submit(_scrape_contact_email_light, website, email_timeout)
+
+    mgmt = _case2_cache_get(website, max_leaders)
+    cached = mgmt is not None
+    if cached:
+        email = ""
+    else:
+        mgmt, email = _enrich_with_case2(
+            company_name=company_name,
+            website=website,
+            max_leaders=max_leaders,
+        )
+
+    # Fallback email scrape (already in flight)
+    if email_future is not None:
+        try:
+            fallback_email = email_future.result()
+        except Exception:
+            fallback_email = ""
+        email = email or fallback_email
+
+    if not cached:
+        _case2_cache_set(website, max_leaders, mgmt)
     return mgmt, email
 
 
@@ -383,7 +703,7 @@ def run_case1_pipeline(
     place: str = "",
     top_n: int = DEFAULT_TOP_N,
     use_gpt: bool = False,
-    debug: bool = True,
+    debug: Optional[bool] = None,
     case2_enabled: Optional[bool] = None,
     case2_max_leaders: Optional[int] = None,
 ) -> Dict[str, Any]:
@@ -392,15 +712,17 @@ def run_case1_pipeline(
     Main pipeline: Case-1 (Google Places) + Case-2 (Leadership) + Excel export
     """
 
-    if case2_enabled is None:
-        case2_enabled = bool(CASE2_ENABLED_DEFAULT)
+    # Console logging is opt-in: explicit argument, else DEBUG_MODE from config
+    debug = DEBUG_MODE if debug is None else bool(debug)
 
-    if case2_max_leaders is None:
-        try:
-            case2_max_leaders = int(CASE2_MAX_LEADERS_DEFAULT or 5)
-        except Exception:
-            case2_max_leaders = 5
-    case2_max_leaders = max(1, min(int(case2_max_leaders), 5))
+    # Snapshot Case-2 settings once; explicit arguments override config
+    case2 = _CASE2_SETTINGS
+    if case2_enabled is not None:
+        case2 = replace(case2, enabled=bool(case2_enabled))
+    if case2_max_leaders is not None:
+        case2 = replace(case2, max_leaders=max(1, min(int(case2_max_leaders), 5)))
+    case2_enabled = case2.enabled
+    case2_max_leaders = case2.max_leaders
 
     location = (location or DEFAULT_LOCATION).strip()
     query = (query or "").strip()
@@ -411,7 +733,7 @@ def run_case1_pipeline(
 
     top_n = _safe_top_n(top_n, DEFAULT_TOP_N, TOP_N_CAP)
 
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    ts = time.strftime("%Y%m%d_%H%M%S")
 
     if debug:
         print(f"\n🚀 PIPELINE START")
@@ -436,96 +758,170 @@ def run_case1_pipeline(
     if debug:
         print(f"\n📊 Case-1 Results: {len(raw_records)} companies fetched")
 
-    cleaned_rows, stats = miner.mine_case1_records(raw_records=raw_records)
-    cleaned_rows = (cleaned_rows or [])[:top_n]
+    # -----------------------------
+    # Mine + Case-2 dispatch (overlapped)
+    # -----------------------------
+    # Rows are mined one at a time and handed to the Case-2 pool immediately,
+    # so network work on early rows starts while later rows are still mined.
+    case2_active = bool(case2_enabled and SCRAPER_CASE2_AVAILABLE)
+    cleaned_rows: List[Dict[str, Any]] = []
+    no_website: List[Tuple[int, str]] = []
+    executor: Optional[ThreadPoolExecutor] = None
+    # One job per unique website; sibling rows (chains, branches) share its result.
+    futures: Dict[Any, List[Tuple[int, Dict[str, Any], str, str]]] = {}
+    by_website: Dict[str, Any] = {}
+    # Jobs whose first row already had an email skip the fallback fetch; an
+    # email-less sibling of such a job gets its own fetch here (once per job)
+    job_fetches_email: Dict[Any, bool] = {}
+    sibling_email: Dict[Any, Any] = {}
+
+    start = time.monotonic()
+    global_timeout = case2.total_timeout_secs  # default 10 min guard
 
-    if debug:
-        print(f"✅ Cleaned: {len(cleaned_rows)} companies ready")
+    try:
+        for i, row in enumerate(islice(miner.iter_case1_records(raw_records), top_n), 1):
+            # ✅ Ensure baseline keys exist for ALL rows (the only validation pass)
+            _apply_row_defaults(row)
+            cleaned_rows.append(row)
+
+            if not case2_active:
+                continue
+
+            # Miner already set "Has Website"; only those rows need URL normalization
+            website, site_key = (
+                _clean_url_and_key(row["Website URL"]) if row.get("Has Website") == "Yes" else ("", "")
+            )
+            company_name = row.get("Company Name", "Unknown")
+
+            if not website:
+                no_website.append((i, company_name))
+                # Still ensure row has empty structure
+                _apply_case2_management_to_row(row, _empty_case2_management(), "")
+                continue
+
+            if site_key in by_website:
+                future = by_website[site_key]
+                futures[future].append((i, row, company_name, website))
+                if (
+                    not row.get("Contact Email")
+                    and not job_fetches_email[future]
+                    and future not in sibling_email
+                ):
+                    sibling_email[future] = _EMAIL_EXECUTOR.submit(
+                        _scrape_contact_email_light, website, case2.timeout_secs
+                    )
+                continue
+
+            # Workers only scrape and return results; rows are mutated on this thread.
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=max(1, min(_CASE2_MAX_WORKERS, top_n)))
+            has_email = bool(row.get("Contact Email"))
+            future = executor.submit(
+                _run_case2_job,
+                company_name,
+                website,
+                case2_max_leaders,
+                has_email,
+                case2.timeout_secs,
+            )
+            futures[future] = [(i, row, company_name, website)]
+            by_website[site_key] = future
+            job_fetches_email[future] = not has_email
+    except BaseException:
+        # Mining failed mid-dispatch: don't leave worker threads scraping in the background
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        raise
+
+    n_clean = len(cleaned_rows)  # fixed from here on; computed once
 
-    # ✅ Ensure baseline keys exist for ALL rows
-    for row in cleaned_rows:
-        row.setdefault("Leadership Found", "No")
-        row.setdefault("case2_management", _empty_case2_management())
-        row.setdefault("Company Name", "Unknown")
-        row.setdefault("Website URL", "")
+    if debug:
+        print(f"✅ Cleaned: {n_clean} companies ready")
 
     # -----------------------------
     # Case-2: Leadership enrichment
     # -----------------------------
-    if case2_enabled and cleaned_rows and SCRAPER_CASE2_AVAILABLE:
+    if case2_active and cleaned_rows:
         if debug:
-            print(f"\n🔍 Starting Case-2 enrichment for {len(cleaned_rows)} companies...")
+            print(f"\n🔍 Starting Case-2 enrichment for {n_clean} companies...")
             print(f"{'='*60}")
-        
-        start = time.time()
-        global_timeout = 600  # 10 min guard
-        success_count = 0
 
-        for i, row in enumerate(cleaned_rows, 1):
-            if time.time() - start > global_timeout:
-                if debug:
-                    print(f"\n🛑 Global timeout reached ({global_timeout}s)")
-                break
+        success_count = 0
 
-            website = _clean_url(row.get("Website URL") or "")
-            company_name = row.get("Company Name", "Unknown")
-            
-            # ✅ IMPROVED: Log all scenarios
-            if not website:
-                if debug:
-                    print(f"⚠️ [{i}/{len(cleaned_rows)}] {company_name} - No website, skipping")
-                # Still ensure row has empty structure
-                _apply_case2_management_to_row(row, _empty_case2_management(), "")
-                continue
+        # ✅ IMPROVED: Log all scenarios
+        if debug:
+            for i, company_name in no_website:
+                print(f"⚠️ [{i}/{n_clean}] {company_name} - No website, skipping")
+            shared = sum(len(v) - 1 for v in futures.values())
+            if shared:
+                print(f"♻️ {shared} row(s) share a website with another row, scraping once")
 
+        try:
+            remaining = max(0.0, global_timeout - (time.monotonic() - start))
+            for future in as_completed(futures, timeout=remaining):
+                try:
+                    mgmt, email = future.result()
+                    error = None
+                except Exception as e:
+                    mgmt, email, error = None, "", e
+
+                if mgmt is not None and not email and future in sibling_email:
+                    try:
+                        email = sibling_email[future].result()
+                    except Exception:
+                        email = ""
+
+                # Per-company lines are buffered and written with one print per job
+                lines: Optional[List[str]] = [] if debug else None
+                for n, (i, row, company_name, website) in enumerate(futures[future]):
+                    if lines is not None:
+                        lines.append(f"\n🔍 [{i}/{n_clean}] {company_name}")
+                        lines.append(f"   Website: {website}")
+
+                    if mgmt is None:
+                        if lines is not None:
+                            lines.append(f"   ❌ ERROR: {str(error)[:150]}")
+                        # ✅ Ensure row still has empty structure
+                        _apply_case2_management_to_row(row, _empty_case2_management(), "")
+                        continue
+
+                    # Apply to row (siblings get their own copy of the shared result)
+                    row_mgmt = mgmt if n == 0 else {b: dict(v) for b, v in mgmt.items()}
+                    _apply_case2_management_to_row(row, row_mgmt, email)
+
+                    # ✅ IMPROVED: Detailed status logging
+                    if row.get("Leadership Found") == "Yes":
+                        success_count += 1
+
+                        if lines is not None:
+                            exec_leader = mgmt.get("Executive Leadership", {})
+                            exec_name = exec_leader.get("name", "N/A")
+                            exec_role = exec_leader.get("designation", "N/A")
+
+                            # Count total leaders found
+                            total_leaders = sum(1 for b in BUCKETS if mgmt.get(b, {}).get("name"))
+
+                            lines.append(f"   ✅ SUCCESS - {total_leaders} leader(s) found")
+                            lines.append(f"   CEO: {exec_name} ({exec_role})")
+                    elif lines is not None:
+                        lines.append(f"   ⚠️ No leaders found")
+
+                if lines:
+                    print("\n".join(lines))
+        except FuturesTimeoutError:
             if debug:
-                print(f"\n🔍 [{i}/{len(cleaned_rows)}] {company_name}")
-                print(f"   Website: {website}")
-
-            try:
-                # Call Case-2 enrichment
-                mgmt, email = _enrich_with_case2(
-                    company_name=company_name,
-                    website=website,
-                    max_leaders=case2_max_leaders,
-                )
-
-                # Fallback email scrape
-                if not email and not (row.get("Contact Email") or "").strip():
-                    email = _scrape_contact_email_light(website, int(CASE2_TIMEOUT_SECS or 10))
-
-                # Apply to row
-                _apply_case2_management_to_row(row, mgmt, email)
-
-                # ✅ IMPROVED: Detailed status logging
-                if row.get("Leadership Found") == "Yes":
-                    success_count += 1
-                    exec_leader = mgmt.get("Executive Leadership", {})
-                    exec_name = exec_leader.get("name", "N/A")
-                    exec_role = exec_leader.get("designation", "N/A")
-                    
-                    # Count total leaders found
-                    total_leaders = sum(1 for b in BUCKETS if mgmt.get(b, {}).get("name"))
-                    
-                    if debug:
-                        print(f"   ✅ SUCCESS - {total_leaders} leader(s) found")
-                        print(f"   CEO: {exec_name} ({exec_role})")
-                else:
-                    if debug:
-                        print(f"   ⚠️ No leaders found")
-                        
-            except Exception as e:
-                if debug:
-                    print(f"   ❌ ERROR: {str(e)[:150]}")
-                # ✅ Ensure row still has empty structure
-                _apply_case2_management_to_row(row, _empty_case2_management(), "")
+                print(f"\n🛑 Global timeout reached ({global_timeout}s)")
+        finally:
+            # Don't block on stragglers after a timeout; queued jobs are dropped.
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
 
         if debug:
-            elapsed = time.time() - start
-            success_rate = (success_count / len(cleaned_rows) * 100) if cleaned_rows else 0
+            elapsed = time.monotonic() - start
+            success_rate = (success_count / n_clean * 100) if n_clean else 0
             print(f"\n{'='*60}")
             print(f"🎯 Case-2 Complete!")
-            print(f"   Success: {success_count}/{len(cleaned_rows)} ({success_rate:.1f}%)")
+            print(f"   Success: {success_count}/{n_clean} ({success_rate:.1f}%)")
             print(f"   Time: {elapsed:.1f}s")
 
     elif debug and case2_enabled:
@@ -538,21 +934,16 @@ def run_case1_pipeline(
     # -----------------------------
     # ✅ IMPROVED: Excel Export with validation
     # -----------------------------
-    os.makedirs("data/output", exist_ok=True)
-    excel_path = os.path.join("data/output", f"case1_{ts}.xlsx")
-    
-    # ✅ Final validation before Excel export
-    for row in cleaned_rows:
-        # Ensure all required keys exist
-        row.setdefault("Leadership Found", "No")
-        row.setdefault("case2_management", _empty_case2_management())
-        row.setdefault("Company Name", "Unknown")
-        row.setdefault("Website URL", "")
-        row.setdefault("Contact Email", "")
-        row.setdefault("Contact Phone", "")
-        row.setdefault("Address", "")
-    
-    excel_utils.write_case1_excel(rows=cleaned_rows, out_path=excel_path)
+    excel_path = os.path.join(OUTPUT_DIR, f"case1_{ts}.xlsx")
+
+    # Baseline keys were filled once at mining time (nothing since removes them)
+    # Bytes come straight from the in-memory workbook (no disk read-back)
+    try:
+        excel_bytes = excel_utils.write_case1_excel(rows=cleaned_rows, out_path=excel_path)
+    except FileNotFoundError:
+        # Working dir changed since import (or folder was removed): create and retry once
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        excel_bytes = excel_utils.write_case1_excel(rows=cleaned_rows, out_path=excel_path)
 
     with_leadership = sum(1 for r in cleaned_rows if r.get("Leadership Found") == "Yes")
 
@@ -560,21 +951,21 @@ def run_case1_pipeline(
         print(f"\n{'='*60}")
         print(f"✅ PIPELINE COMPLETE!")
         print(f"📊 Results:")
-        print(f"   Total companies: {len(cleaned_rows)}")
+        print(f"   Total companies: {n_clean}")
         print(f"   With leaders: {with_leadership}")
-        print(f"   Success rate: {with_leadership}/{len(cleaned_rows)} ({100*with_leadership//len(cleaned_rows) if cleaned_rows else 0}%)")
+        print(f"   Success rate: {with_leadership}/{n_clean} ({100*with_leadership//n_clean if n_clean else 0}%)")
         print(f"📁 Excel: {excel_path}")
         print(f"{'='*60}\n")
 
     return {
         "excel_path": excel_path,
-        "excel_bytes": _read_bytes(excel_path),
+        "excel_bytes": excel_bytes,
         "cleaned_rows": cleaned_rows,
         "stats": {
-            "clean_count": len(cleaned_rows),
+            "clean_count": n_clean,
             "with_leadership": with_leadership,
             "with_leaders": with_leadership,
-            "success_rate": f"{with_leadership}/{len(cleaned_rows)}" if cleaned_rows else "0/0",
+            "success_rate": f"{with_leadership}/{n_clean}" if n_clean else "0/0",
         },
         "raw_path": raw_path,
     }
\ No newline at end of file
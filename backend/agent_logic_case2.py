@@ -12,54 +12,76 @@
 
 from __future__ import annotations
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Iterable, Iterator
+import os
 import re
+import importlib
+import sys
+import sqlite3
+import asyncio
 import json
 import time
 import random
 import logging
+import threading
+from functools import lru_cache, cached_property
+from contextlib import contextmanager
+from urllib.parse import urlsplit
 
-try:
-    from backend.config import (
-        CASE2_ENABLED,
-        CASE2_MAX_LEADERS,
-        AGENT_MAX_RETRIES,
-        AGENT_RETRY_DELAY_MIN,
-        AGENT_RETRY_DELAY_MAX,
-        AGENT_ALTERNATE_PATHS,
-    )
-except ImportError:
-    from config import (
-        CASE2_ENABLED,
-        CASE2_MAX_LEADERS,
-        AGENT_MAX_RETRIES,
-        AGENT_RETRY_DELAY_MIN,
-        AGENT_RETRY_DELAY_MAX,
-        AGENT_ALTERNATE_PATHS,
-    )
 
-# 🆕 SCRAPING-FIRST module - AI-POWERED
-try:
-    from backend.scraper_ai_powered import run_discovery_sync
-except ImportError:
-    try:
-        from scraper_ai_powered import run_discovery_sync
-    except ImportError:
-        # Fallback to old scraper
+def _first_import(names: Iterable[str]) -> Any:
+    """First importable module from a priority list (package path, then flat)."""
+    errors = []
+    for name in names:
         try:
-            from backend.scraper_case2 import run_discovery_sync
-        except ImportError:
-            from scraper_case2 import run_discovery_sync
+            return importlib.import_module(name)
+        except ImportError as e:
+            errors.append(f"{name}: {e}")
+    raise ImportError("; ".join(errors))
+
+
+_cfg = _first_import(("backend.config", "config"))
+CASE2_ENABLED = _cfg.CASE2_ENABLED
+CASE2_MAX_LEADERS = _cfg.CASE2_MAX_LEADERS
+CASE2_CACHE_TTL_HOURS = _cfg.CASE2_CACHE_TTL_HOURS
+CASE2_CACHE_PATH = _cfg.CASE2_CACHE_PATH
+AGENT_MAX_RETRIES = _cfg.AGENT_MAX_RETRIES
+AGENT_RETRY_DELAY_MIN = _cfg.AGENT_RETRY_DELAY_MIN
+AGENT_RETRY_DELAY_MAX = _cfg.AGENT_RETRY_DELAY_MAX
+AGENT_ALTERNATE_PATHS = _cfg.AGENT_ALTERNATE_PATHS
+
+# 🆕 SCRAPING-FIRST module - AI-POWERED (fallback to old scraper)
+run_discovery_sync = _first_import((
+    "backend.scraper_ai_powered",
+    "scraper_ai_powered",
+    "backend.scraper_case2",
+    "scraper_case2",
+)).run_discovery_sync
 
 # LLM Client for decision making
+GeminiClient = _first_import(("backend.gpt_client", "gpt_client")).GeminiClient
+
+# Optional fast JSON (payload parsing + cache writes); stdlib json fallback
 try:
-    from backend.gpt_client import GeminiClient
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    ORJSON_AVAILABLE = True
 except ImportError:
-    from gpt_client import GeminiClient
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+    ORJSON_AVAILABLE = False
 
 # Optional DB cache
 try:
-    from backend import db
+    db = _first_import(("backend.db",))
 except Exception:
     db = None
 
@@ -82,7 +104,8 @@ def _max_leaders() -> int:
 
 
 def _norm(s: Any) -> str:
-    return re.sub(r"\s+", " ", ("" if s is None else str(s)).strip())
+    # split()/join collapses whitespace runs in C (no regex per call)
+    return " ".join(("" if s is None else str(s)).split())
 
 
 def _safe_json_load(x: Any) -> Any:
@@ -90,17 +113,22 @@ def _safe_json_load(x: Any) -> Any:
         return None
     if isinstance(x, (dict, list)):
         return x
-    if isinstance(x, str):
+    if isinstance(x, (str, bytes)):
+        # bytes go straight to the parser (no utf-8 decode step first)
         s = x.strip()
         if not s:
             return None
         try:
-            return json.loads(s)
+            return _json_loads(s)
         except Exception:
             return None
     return None
 
 
+# Plain prefix test (str.startswith with a tuple) instead of a ^https?:// regex
+_HTTP_PREFIXES = ("http://", "https://")
+
+
 def _make_cache_key(company_name: str, website_url: str, cache_key: str = "") -> str:
     if cache_key:
         return _norm(cache_key)
@@ -109,7 +137,10 @@ def _make_cache_key(company_name: str, website_url: str, cache_key: str = "") ->
     company_name = _norm(company_name)
 
     try:
-        host = re.sub(r"^www\.", "", re.sub(r"^https?://", "", website_url)).split("/")[0].strip().lower()
+        # urlsplit (C-level) hands back the lowercased host; port/userinfo dropped
+        host = urlsplit(website_url if "://" in website_url else "http://" + website_url).hostname or ""
+        if host.startswith("www."):
+            host = host[4:]
     except Exception:
         host = website_url.strip().lower()
 
@@ -119,18 +150,28 @@ def _make_cache_key(company_name: str, website_url: str, cache_key: str = "") ->
 # -----------------------------
 # Buckets
 # -----------------------------
-BUCKETS = [
+# Interned: bucket names / cell keys hit dict lookups on every record, and
+# identical interned strings compare by identity
+BUCKETS = tuple(sys.intern(b) for b in (
     "Executive Leadership",
     "Technology / Operations",
     "Finance / Administration",
     "Business Development / Growth",
     "Marketing / Branding",
-]
+))
+_MGMT_FIELDS = tuple(sys.intern(k) for k in ("name", "designation", "email", "phone", "linkedin"))
+
+
+# Built once; only immutable strings inside, so a per-bucket dict.copy()
+# is a full clone (no deepcopy needed)
+_EMPTY_MGMT_TEMPLATE: Dict[str, Dict[str, str]] = {
+    b: dict.fromkeys(_MGMT_FIELDS, "") for b in BUCKETS
+}
+_EMPTY_MGMT_ITEMS = tuple(_EMPTY_MGMT_TEMPLATE.items())
 
 
 def _empty_management() -> Dict[str, Dict[str, str]]:
-    base = {"name": "", "designation": "", "email": "", "phone": "", "linkedin": ""}
-    return {b: dict(base) for b in BUCKETS}
+    return {b: cell.copy() for b, cell in _EMPTY_MGMT_ITEMS}
 
 
 def _leadership_found_strict(mgmt: Dict[str, Dict[str, str]]) -> bool:
@@ -195,169 +236,326 @@ _BUCKET_RULES: List[Tuple[str, List[str]]] = [
 ]
 
 
+# Keywords are lowercase by convention; enforce it once (and intern them)
+# so the lowercased role can be matched without per-call normalization.
+_BUCKET_RULES = [
+    (sys.intern(bucket), [sys.intern(k.lower()) for k in keys]) for bucket, keys in _BUCKET_RULES
+]
+
+# Optional Aho-Corasick automaton: finds every keyword occurrence in one
+# O(len(role)) C pass; the lowest bucket index among hits keeps the
+# "first bucket in _BUCKET_RULES order" semantics.
+try:
+    import ahocorasick
+
+    _ROLE_AUTOMATON = ahocorasick.Automaton()
+    for _i, (_bucket, _keys) in enumerate(_BUCKET_RULES):
+        for _k in _keys:
+            if _k not in _ROLE_AUTOMATON:  # same keyword in 2 buckets -> earlier bucket
+                _ROLE_AUTOMATON.add_word(_k, (_i, _bucket))
+    _ROLE_AUTOMATON.make_automaton()
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    _ROLE_AUTOMATON = None
+    AHOCORASICK_AVAILABLE = False
+
+# Fallback: one compiled regex for all buckets. Each branch is a lookahead ("does ANY
+# keyword of this bucket occur anywhere?") tagged by an empty named group;
+# anchored alternation tries branches left to right, so the FIRST bucket in
+# _BUCKET_RULES order wins -- same result as the nested keyword loop.
+_BUCKET_REGEX = re.compile(
+    "^(?:"
+    + "|".join(
+        f"(?=.*?(?:{'|'.join(map(re.escape, keys))}))(?P<b{i}>)"
+        for i, (_, keys) in enumerate(_BUCKET_RULES)
+    )
+    + ")",
+    re.DOTALL,
+)
+_BUCKET_BY_GROUP: Dict[str, str] = {f"b{i}": name for i, (name, _) in enumerate(_BUCKET_RULES)}
+
+
 def _map_role_to_bucket(role: str) -> str:
     r = _norm(role).lower()
     if not r:
         return ""
-    for bucket, keys in _BUCKET_RULES:
-        for k in keys:
-            if k in r:
-                return bucket
-    return ""
+    if _ROLE_AUTOMATON is not None:
+        best_i, best_bucket = len(_BUCKET_RULES), ""
+        for _, (i, bucket) in _ROLE_AUTOMATON.iter(r):
+            if i < best_i:
+                best_i, best_bucket = i, bucket
+                if i == 0:
+                    break
+        return best_bucket
+    m = _BUCKET_REGEX.match(r)
+    return _BUCKET_BY_GROUP[m.lastgroup] if m else ""
 
 
-def _clean_leaders_list(value: Any, max_leaders: int = 5) -> List[Dict[str, str]]:
-    if max_leaders <= 0:
-        max_leaders = 5
+# Payload keys that may hold the raw leader list, in priority order
+_LEADER_KEYS = ("leaders_raw", "all_leaders", "leaders")
+
+
+def _extract_leaders_field(payload: Any) -> Any:
+    """First non-empty leader list field of a dict payload; non-dicts pass through."""
+    if not isinstance(payload, dict):
+        return payload
+    for k in _LEADER_KEYS:
+        v = payload.get(k)
+        if v:
+            return v
+    return []
+
 
+def _leaders_source(value: Any) -> List[Any]:
+    """Raw leader list from a payload (dict / json-string / list); [] if none."""
     parsed = _safe_json_load(value)
     if parsed is not None:
         value = parsed
 
-    if isinstance(value, dict):
-        value = value.get("leaders_raw") or value.get("leaders") or value.get("all_leaders") or []
+    value = _extract_leaders_field(value)
+    return value if isinstance(value, list) else []
 
-    if not isinstance(value, list):
-        return []
+
+def _clean_leaders_list(value: Any, max_leaders: int = 5) -> List[Dict[str, str]]:
+    return _walk_leaders(value, max_leaders)[0]
+
+
+def _walk_leaders(
+    value: Any,
+    max_leaders: int = 5,
+    mgmt_cap: int = 0,
+    email: str = "",
+) -> Tuple[List[Dict[str, str]], Optional[Dict[str, Dict[str, str]]]]:
+    """
+    Single traversal of a leader list -> (deduped leaders, bucketed management).
+    Leaders stop at max_leaders; management is built from the first mgmt_cap
+    clean leaders (first leader per bucket wins). mgmt_cap=0 skips management.
+    """
+    if max_leaders <= 0:
+        max_leaders = 5
+    stop = max(max_leaders, mgmt_cap)
 
     out: List[Dict[str, str]] = []
+    mgmt = _empty_management() if mgmt_cap > 0 else None
     seen = set()
-    for it in value:
+    seen_buckets = set()
+    for it in _leaders_source(value):
         if not isinstance(it, dict):
             continue
+        # Cheapest rejects first: no name / already-seen name skips role work
         nm = _norm(it.get("name", ""))
-        rl = _norm(it.get("role", "")) or _norm(it.get("designation", ""))
-        if not nm or not rl:
+        if not nm:
             continue
         key = nm.lower()
         if key in seen:
             continue
+        rl = _norm(it.get("role", "")) or _norm(it.get("designation", ""))
+        if not rl:
+            continue
         seen.add(key)
-        out.append({"name": nm, "role": rl})
-        if len(out) >= max_leaders:
+        if len(out) < max_leaders:
+            out.append({"name": nm, "role": rl})
+
+        if mgmt is not None and len(seen) <= mgmt_cap and len(seen_buckets) < 5:
+            bucket = _map_role_to_bucket(rl)
+            if bucket and bucket not in seen_buckets:
+                mgmt[bucket]["name"] = nm
+                mgmt[bucket]["designation"] = rl
+                if bucket == "Executive Leadership" and email:
+                    mgmt[bucket]["email"] = _norm(email)
+                seen_buckets.add(bucket)
+
+        if len(seen) >= stop:
             break
-    return out
+    return out, mgmt
 
 
-def _leaders_to_management(leaders: List[Dict[str, str]], email: str = "") -> Dict[str, Dict[str, str]]:
-    mgmt = _empty_management()
-    seen_buckets = set()
+def _management_from_bucket_dict(payload: Dict[str, Any], email: str = "") -> Optional[Dict[str, Dict[str, str]]]:
+    """Bucketed management straight from the payload, or None if it has no bucket dict."""
+    mgmt = payload.get("case2_management") or payload.get("leaders_by_category")
+    if isinstance(mgmt, str):
+        mgmt = _safe_json_load(mgmt)
 
-    for it in leaders or []:
-        name = _norm(it.get("name", ""))
-        role = _norm(it.get("role", "")) or _norm(it.get("designation", ""))
-        if not name or not role:
-            continue
+    if not isinstance(mgmt, dict):
+        return None
 
-        bucket = _map_role_to_bucket(role)
-        if not bucket:
-            continue
-        if bucket in seen_buckets:
-            continue
+    base = _empty_management()
+    for b in BUCKETS:
+        v = mgmt.get(b)
+        if isinstance(v, dict):
+            nm = _norm(v.get("name", ""))
+            dg = _norm(v.get("designation", "")) or _norm(v.get("role", ""))
+
+            if nm:
+                base[b]["name"] = nm
+                base[b]["designation"] = dg
+                base[b]["email"] = _norm(v.get("email", "")) or base[b]["email"]
+                base[b]["phone"] = _norm(v.get("phone", "")) or base[b]["phone"]
+                base[b]["linkedin"] = _norm(v.get("linkedin", "")) or base[b]["linkedin"]
+        elif isinstance(v, list) and v:
+            # Handle list format from AI scraper
+            first = v[0] if isinstance(v[0], dict) else {}
+            nm = _norm(first.get("name", ""))
+            dg = _norm(first.get("role", ""))
+            
+            if nm:
+                base[b]["name"] = nm
+                base[b]["designation"] = dg
 
-        mgmt[bucket]["name"] = name
-        mgmt[bucket]["designation"] = role
+    if email and not base["Executive Leadership"]["email"]:
+        base["Executive Leadership"]["email"] = _norm(email)
 
-        if bucket == "Executive Leadership" and email:
-            mgmt[bucket]["email"] = _norm(email)
+    return base
 
-        seen_buckets.add(bucket)
-        if len(seen_buckets) >= 5:
-            break
 
-    return mgmt
+def _extract_all(
+    payload: Any,
+    email: str = "",
+    max_leaders: int = 5,
+) -> Tuple[List[Dict[str, str]], Dict[str, Dict[str, str]]]:
+    """
+    (leaders, management) from ONE walk of the payload's leader list.
+    A bucket dict in the payload wins for management; otherwise the first
+    _max_leaders() clean leaders are mapped to buckets in the same pass.
+    """
+    if isinstance(payload, dict):
+        mgmt = _management_from_bucket_dict(payload, email=email)
+    else:
+        mgmt = _empty_management()
+
+    leaders, list_mgmt = _walk_leaders(
+        payload,
+        max_leaders=max_leaders,
+        mgmt_cap=_max_leaders() if mgmt is None else 0,
+        email=email,
+    )
+    return leaders, (mgmt if mgmt is not None else list_mgmt)
 
 
 def _normalize_management_from_payload(payload: Any, email: str = "") -> Dict[str, Dict[str, str]]:
-    base = _empty_management()
+    return _extract_all(payload, email=email, max_leaders=_max_leaders())[1]
 
-    if not isinstance(payload, dict):
-        return base
 
-    mgmt = payload.get("case2_management") or payload.get("leaders_by_category")
-    if isinstance(mgmt, str):
-        mgmt = _safe_json_load(mgmt)
+# ------------------------------------------------------------
+# Cache helpers
+# ------------------------------------------------------------
+_CACHE_LOCK = threading.Lock()
+_CACHE_READY = False
 
-    if isinstance(mgmt, dict):
-        for b in BUCKETS:
-            v = mgmt.get(b)
-            if isinstance(v, dict):
-                nm = _norm(v.get("name", ""))
-                dg = _norm(v.get("designation", "")) or _norm(v.get("role", ""))
-
-                if nm:
-                    base[b]["name"] = nm
-                    base[b]["designation"] = dg
-                    base[b]["email"] = _norm(v.get("email", "")) or base[b]["email"]
-                    base[b]["phone"] = _norm(v.get("phone", "")) or base[b]["phone"]
-                    base[b]["linkedin"] = _norm(v.get("linkedin", "")) or base[b]["linkedin"]
-            elif isinstance(v, list) and v:
-                # Handle list format from AI scraper
-                first = v[0] if isinstance(v[0], dict) else {}
-                nm = _norm(first.get("name", ""))
-                dg = _norm(first.get("role", ""))
-                
-                if nm:
-                    base[b]["name"] = nm
-                    base[b]["designation"] = dg
 
-        if email and not base["Executive Leadership"]["email"]:
-            base["Executive Leadership"]["email"] = _norm(email)
+def _cache_ready() -> bool:
+    """Create cache tables once per process (backend.db or the local fallback store)."""
+    global _CACHE_READY
+    if _CACHE_READY:
+        return True
+    with _CACHE_LOCK:
+        if not _CACHE_READY:
+            try:
+                if db:
+                    db.init_db()
+                else:
+                    with _local_cache_conn() as conn:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.execute(
+                            "CREATE TABLE IF NOT EXISTS cache(key TEXT PRIMARY KEY, ts INTEGER, payload TEXT)"
+                        )
+                _CACHE_READY = True
+            except Exception as e:
+                logger.warning(f"⚠️ Case-2 cache disabled: {e}")
+    return _CACHE_READY
 
-        return base
 
-    leaders = _clean_leaders_list(payload, max_leaders=_max_leaders())
-    return _leaders_to_management(leaders, email=email)
+@contextmanager
+def _local_cache_conn() -> Iterator[sqlite3.Connection]:
+    # One short-lived connection per call (batch workers run in threads);
+    # commits on success, always closes.
+    path = os.path.expanduser(CASE2_CACHE_PATH)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path, timeout=10)
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
 
 
-# ------------------------------------------------------------
-# Cache helpers
-# ------------------------------------------------------------
 def _cache_get(cache_key: str) -> Optional[Dict[str, Any]]:
-    if not db:
+    if not _cache_ready():
+        return None
+    try:
+        if db:
+            return db.get_case2_cache(cache_key, ttl_hours=CASE2_CACHE_TTL_HOURS)
+        with _local_cache_conn() as conn:
+            row = conn.execute(
+                "SELECT payload FROM cache WHERE key = ? AND ts >= ?",
+                (cache_key, int(time.time()) - CASE2_CACHE_TTL_HOURS * 3600),
+            ).fetchone()
+        payload = _safe_json_load(row[0]) if row else None
+        return payload if isinstance(payload, dict) else None
+    except Exception:
         return None
-    fn = getattr(db, "get_case2_cache", None)
-    if callable(fn):
-        try:
-            return fn(cache_key)
-        except Exception:
-            return None
-    return None
 
 
 def _cache_set(cache_key: str, payload: Dict[str, Any]) -> None:
-    if not db:
+    if not _cache_ready():
         return
-    fn = getattr(db, "save_case2_cache", None)
-    if callable(fn):
-        try:
-            fn(cache_key, payload)
-        except Exception:
-            pass
+    try:
+        if db:
+            db.save_case2_cache(cache_key, payload)
+            return
+        with _local_cache_conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache(key, ts, payload) VALUES (?, ?, ?)",
+                (cache_key, int(time.time()), _json_dumps(payload)),
+            )
+    except Exception:
+        pass
 
 
 # ------------------------------------------------------------
 # 🤖 AGENTIC LOGIC
 # ------------------------------------------------------------
+def _backoff_delay(attempt: int) -> float:
+    """
+    Exponential backoff with jitter: base * 2^(attempt-1), capped, then x0.5-1.5.
+    base/cap come from AGENT_RETRY_DELAY_MIN / AGENT_RETRY_DELAY_MAX.
+    """
+    base = max(0.1, float(AGENT_RETRY_DELAY_MIN))
+    cap = max(base, float(AGENT_RETRY_DELAY_MAX))
+    return min(cap, base * 2 ** max(0, attempt - 1)) * random.uniform(0.5, 1.5)
+
+
+@lru_cache(maxsize=1)
+def _get_llm_client() -> GeminiClient:
+    """One LLM client per process (construction is the expensive part)."""
+    return GeminiClient()
+
+
 class Case2Agent:
     """Autonomous agent for Case 2 with retry and decision logic"""
     
-    def __init__(self):
+    # LLM client is built on first access only: rule-based runs never pay for it
+    @cached_property
+    def llm_client(self) -> GeminiClient:
+        return _get_llm_client()
+
+    @cached_property
+    def use_llm_decisions(self) -> bool:
         try:
-            self.llm_client = GeminiClient()
-            self.use_llm_decisions = self.llm_client.is_enabled()
+            enabled = bool(self.llm_client.is_enabled())
         except:
-            self.use_llm_decisions = False
-        
-        if self.use_llm_decisions:
-            logger.info("🤖 Agent initialized with LLM decision making")
+            enabled = False
+
+        if enabled:
+            logger.info("🤖 Agent using LLM decision making")
         else:
-            logger.info("🤖 Agent initialized with rule-based decision making")
+            logger.info("🤖 Agent using rule-based decision making")
+        return enabled
     
     def _get_base_url(self, url: str) -> str:
         url = _norm(url)
         try:
-            url_clean = re.sub(r'^https?://', '', url)
+            url_clean = url.partition("://")[2] if url.startswith(_HTTP_PREFIXES) else url
             base = url_clean.split('?')[0].rstrip('/')
             return f"https://{base}"
         except:
@@ -366,6 +564,8 @@ class Case2Agent:
     def _try_alternate_urls(self, base_url: str, company_name: str) -> Tuple[Optional[Dict], str]:
         base = self._get_base_url(base_url)
         
+        # Sequential on purpose: one request in flight per host (batch callers
+        # already parallelize across companies), and the first hit stops the probe
         for path in AGENT_ALTERNATE_PATHS:
             url = f"{base}{path}"
             logger.info(f"🔍 Trying alternate URL: {url}")
@@ -373,7 +573,7 @@ class Case2Agent:
             try:
                 payload, email = run_discovery_sync(website=url, company_name=company_name)
                 
-                leaders = _clean_leaders_list(payload.get("leaders_raw") if isinstance(payload, dict) else payload)
+                leaders = _clean_leaders_list(_extract_leaders_field(payload))
                 if leaders:
                     logger.info(f"✅ Found {len(leaders)} leaders at {url}")
                     return (payload, email)
@@ -421,13 +621,11 @@ class Case2Agent:
             try:
                 payload, email = run_discovery_sync(website=website_url, company_name=company_name)
                 
-                leaders = _clean_leaders_list(
-                    payload.get("leaders_raw") or payload.get("all_leaders") if isinstance(payload, dict) else payload
-                )
+                leaders, mgmt = _extract_all(payload, email=email)
                 
                 if leaders:
                     logger.info(f"✅ Success! Found {len(leaders)} leaders")
-                    return self._build_output(payload, email, leaders)
+                    return self._build_output(leaders, mgmt, email)
                 
                 context = {
                     "attempt": attempt,
@@ -444,19 +642,17 @@ class Case2Agent:
                     alt_payload, alt_email = self._try_alternate_urls(website_url, company_name)
                     
                     if alt_payload:
-                        alt_leaders = _clean_leaders_list(
-                            alt_payload.get("leaders_raw") or alt_payload.get("all_leaders") if isinstance(alt_payload, dict) else alt_payload
-                        )
+                        alt_leaders, alt_mgmt = _extract_all(alt_payload, email=alt_email)
                         if alt_leaders:
                             logger.info(f"✅ Success via alternate URL! Found {len(alt_leaders)} leaders")
-                            return self._build_output(alt_payload, alt_email, alt_leaders)
+                            return self._build_output(alt_leaders, alt_mgmt, alt_email)
                 
                 elif action == "SKIP":
                     logger.warning(f"⏭️ Skipping after {attempt} attempts")
                     break
                 
                 if attempt < AGENT_MAX_RETRIES:
-                    delay = random.uniform(AGENT_RETRY_DELAY_MIN, AGENT_RETRY_DELAY_MAX)
+                    delay = _backoff_delay(attempt)
                     logger.info(f"⏳ Waiting {delay:.1f}s before next attempt...")
                     time.sleep(delay)
                 
@@ -476,15 +672,12 @@ class Case2Agent:
                     break
                 
                 if attempt < AGENT_MAX_RETRIES:
-                    delay = random.uniform(AGENT_RETRY_DELAY_MIN, AGENT_RETRY_DELAY_MAX)
-                    time.sleep(delay)
+                    time.sleep(_backoff_delay(attempt))
         
         logger.error(f"❌ Failed after {AGENT_MAX_RETRIES} attempts")
-        return self._build_output({}, "", [])
+        return self._build_output([], _empty_management(), "")
     
-    def _build_output(self, payload: Dict, email: str, leaders: List[Dict]) -> Dict[str, Any]:
-        mgmt = _normalize_management_from_payload(payload, email=email)
-        
+    def _build_output(self, leaders: List[Dict], mgmt: Dict[str, Dict[str, str]], email: str) -> Dict[str, Any]:
         return {
             "case2_leaders": leaders,
             "case2_email": _norm(email),
@@ -493,9 +686,32 @@ class Case2Agent:
         }
 
 
+_AGENT_SINGLETON: Optional[Case2Agent] = None
+_AGENT_LOCK = threading.Lock()
+
+
+def _get_agent() -> Case2Agent:
+    """Shared agent (stateless per call), built once even under batch threads."""
+    global _AGENT_SINGLETON
+    if _AGENT_SINGLETON is None:
+        with _AGENT_LOCK:
+            if _AGENT_SINGLETON is None:
+                _AGENT_SINGLETON = Case2Agent()
+    return _AGENT_SINGLETON
+
+
 # ------------------------------------------------------------
 # Public API
 # ------------------------------------------------------------
+def _empty_output() -> Dict[str, Any]:
+    return {
+        "case2_leaders": [],
+        "case2_email": "",
+        "case2_management": _empty_management(),
+        "Leadership Found": "No",
+    }
+
+
 def run_case2_enrichment(
     company_name: str,
     website_url: str,
@@ -514,12 +730,7 @@ def run_case2_enrichment(
     Returns:
         Dict with case2_leaders, case2_email, case2_management, Leadership Found
     """
-    out: Dict[str, Any] = {
-        "case2_leaders": [],
-        "case2_email": "",
-        "case2_management": _empty_management(),
-        "Leadership Found": "No",
-    }
+    out = _empty_output()
 
     if not CASE2_ENABLED:
         return out
@@ -545,17 +756,13 @@ def run_case2_enrichment(
 
     # Scrape with agent or direct
     if use_agent:
-        agent = Case2Agent()
+        agent = _get_agent()
         result = agent.scrape_with_agent(company_name, website_url)
     else:
         try:
             payload, email = run_discovery_sync(website=website_url, company_name=company_name)
             email = _norm(email)
-            leaders = _clean_leaders_list(
-                payload.get("leaders_raw") or payload.get("all_leaders") if isinstance(payload, dict) else payload,
-                max_leaders=_max_leaders(),
-            )
-            mgmt = _normalize_management_from_payload(payload, email=email)
+            leaders, mgmt = _extract_all(payload, email=email, max_leaders=_max_leaders())
             
             result = {
                 "case2_leaders": leaders,
@@ -574,15 +781,114 @@ def run_case2_enrichment(
     return result
 
 
+# ------------------------------------------------------------
+# Batch API (concurrent, I/O-bound)
+# ------------------------------------------------------------
+async def run_case2_enrichment_async(
+    company_name: str,
+    website_url: str,
+    cache_key: str = "",
+    use_agent: bool = True,
+) -> Dict[str, Any]:
+    """Async wrapper: the scraper stays sync, so it runs in a worker thread."""
+    return await asyncio.to_thread(
+        run_case2_enrichment, company_name, website_url, cache_key, use_agent
+    )
+
+
+class _QpmLimiter:
+    """Spaces task starts so the batch never exceeds `qpm` starts per minute."""
+
+    def __init__(self, qpm: int):
+        self._interval = 60.0 / qpm if qpm and qpm > 0 else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self._interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# Accepted record keys, in priority order (first truthy value wins)
+_COMPANY_KEYS = ("company_name", "Company Name", "name")
+_WEBSITE_KEYS = ("website_url", "Website URL", "website")
+
+
+def _first_value(rec: Dict[str, Any], keys: Tuple[str, ...]) -> str:
+    for k in keys:
+        v = rec.get(k)
+        if v:
+            return str(v)
+    return ""
+
+
+def _record_company_and_website(rec: Dict[str, Any]) -> Tuple[str, str]:
+    return _first_value(rec, _COMPANY_KEYS), _first_value(rec, _WEBSITE_KEYS)
+
+
+async def enrich_many(
+    records: Iterable[Dict[str, Any]],
+    concurrency: int = 16,
+    qpm: int = 500,
+    use_agent: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Enrich many companies concurrently.
+
+    records: dicts with company_name/website_url (or "Company Name"/"Website URL").
+    Returns one Case-2 output per record, in input order; a failed company
+    gets the empty output instead of failing the batch.
+    """
+    sem = asyncio.Semaphore(max(1, int(concurrency or 1)))
+    limiter = _QpmLimiter(qpm)
+
+    async def _one(rec: Dict[str, Any]) -> Dict[str, Any]:
+        company, website = _record_company_and_website(rec)
+        async with sem:
+            await limiter.wait()
+            return await run_case2_enrichment_async(company, website, use_agent=use_agent)
+
+    results = await asyncio.gather(*(_one(r) for r in records), return_exceptions=True)
+
+    out: List[Dict[str, Any]] = []
+    for res in results:
+        if isinstance(res, BaseException):
+            logger.error(f"Batch enrichment error: {res}")
+            out.append(_empty_output())
+        else:
+            out.append(res)
+    return out
+
+
+def enrich_many_sync(
+    records: Iterable[Dict[str, Any]],
+    concurrency: int = 16,
+    qpm: int = 500,
+    use_agent: bool = True,
+) -> List[Dict[str, Any]]:
+    """Sync shim for scripts (not for use inside a running event loop)."""
+    return asyncio.run(enrich_many(records, concurrency=concurrency, qpm=qpm, use_agent=use_agent))
+
+
 # Backward compatibility
+# Legacy "Leader i Name/Role" column keys (no per-call f-strings)
+_LEADER_COLS = tuple((f"Leader {i} Name", f"Leader {i} Role") for i in range(1, 6))
+
+
 def run_case2_top_management(company_name: str, website_url: str) -> Dict[str, Any]:
     """Legacy wrapper"""
     output: Dict[str, Any] = {}
     max_leaders = _max_leaders()
 
-    for i in range(1, 6):
-        output[f"Leader {i} Name"] = ""
-        output[f"Leader {i} Role"] = ""
+    for name_col, role_col in _LEADER_COLS:
+        output[name_col] = ""
+        output[role_col] = ""
 
     if not CASE2_ENABLED:
         output["case2_leaders"] = []
@@ -598,9 +904,10 @@ def run_case2_top_management(company_name: str, website_url: str) -> Dict[str, A
     leaders = (data.get("case2_leaders") or [])[:max_leaders]
     output["case2_leaders"] = leaders
 
-    for idx, leader in enumerate(leaders[:5]):
-        col = idx + 1
-        output[f"Leader {col} Name"] = _norm(leader.get("name", "")) or ""
-        output[f"Leader {col} Role"] = _norm(leader.get("role", "")) or ""
+    # case2_leaders come out of _walk_leaders already normalized (no re-_norm)
+    # max_leaders <= 5 and zip stops at the 5 column pairs -> no second slice
+    for (name_col, role_col), leader in zip(_LEADER_COLS, leaders):
+        output[name_col] = leader.get("name", "") or ""
+        output[role_col] = leader.get("role", "") or ""
 
     return output
\ No newline at end of file
@@ -3,10 +3,16 @@ batch_process.py - Batch Process Companies from Excel
 Processes all companies and saves leadership data to Excel
 """
 import pandas as pd
+from openpyxl import Workbook
 from agent_logic_case2 import run_case2_enrichment
+import csv
 import json
-import time
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from urllib.parse import urlsplit
 
 print("="*80)
 print("🚀 BATCH PROCESSING - Leadership Data Extraction")
@@ -15,15 +21,96 @@ print("="*80)
 # Input file (change if needed)
 INPUT_FILE = '../case1_Manufacturing_industries.xlsx'
 
+
+
+# First line of a sidecar: column dtypes, so the CSV reads back as read_excel gave it
+_SIDECAR_DTYPES = "#dtypes:"
+# Dedicated name so cleanup can never match a user's own files next to the input
+_SIDECAR_RE_TEMPLATE = r"{name}\.sidecar-\d+-\d+\.csv"
+
+
+def _sidecar_path(path, st):
+    return f"{path}.sidecar-{st.st_mtime_ns}-{st.st_size}.csv"
+
+
+def _csv_round_trips(frame):
+    """
+    True when every column comes back from CSV unchanged: numbers, bools,
+    datetimes and all-text columns. A mixed column (e.g. Phone [123, 'x'])
+    would come back all-text, so such workbooks are simply not cached.
+    """
+    for col, dtype in frame.dtypes.items():
+        if dtype.kind in 'iufbM':
+            continue
+        if not frame[col].dropna().map(type).eq(str).all():
+            return False
+    return True
+
+
+def _write_sidecar(frame, cache_path):
+    with open(cache_path, 'w', newline='', encoding='utf-8') as f:
+        f.write(_SIDECAR_DTYPES + json.dumps({c: str(t) for c, t in frame.dtypes.items()}) + "\n")
+        frame.to_csv(f, index=False)
+
+
+def _read_sidecar(cache_path):
+    with open(cache_path, newline='', encoding='utf-8') as f:
+        head = f.readline()
+        if not head.startswith(_SIDECAR_DTYPES):
+            raise ValueError("not a sidecar")
+        dtypes = json.loads(head[len(_SIDECAR_DTYPES):])
+        dates = [c for c, t in dtypes.items() if t.startswith('datetime64')]
+        frame = pd.read_csv(
+            f,
+            dtype={c: t for c, t in dtypes.items() if c not in dates},
+            parse_dates=dates,
+        )
+    if list(frame.columns) != list(dtypes):
+        raise ValueError("sidecar columns changed")
+    return frame
+
+
+def _remove_old_sidecars(path, keep):
+    folder, name = os.path.split(os.path.abspath(path))
+    pattern = re.compile(_SIDECAR_RE_TEMPLATE.format(name=re.escape(name)))
+    keep = os.path.basename(keep)
+    for entry in os.listdir(folder):
+        if entry != keep and pattern.fullmatch(entry):
+            os.remove(os.path.join(folder, entry))
+
+
+def _read_input(path):
+    """
+    Parse the workbook once per version: a CSV sidecar keyed by the file's
+    mtime + size lets re-runs (resume after a crash) skip openpyxl's XML parse.
+    Plain text on purpose -- loading it can't execute anything.
+    """
+    st = os.stat(path)
+    cache_path = _sidecar_path(path, st)
+    if os.path.exists(cache_path):
+        try:
+            return _read_sidecar(cache_path)
+        except Exception:
+            pass  # unreadable sidecar -> parse the workbook again
+    frame = pd.read_excel(path)
+    if _csv_round_trips(frame):
+        try:
+            _write_sidecar(frame, cache_path)
+            # only our own sidecars for older versions of this workbook
+            _remove_old_sidecars(path, cache_path)
+        except Exception:
+            pass  # read-only dir etc.: caching is best-effort
+    return frame
+
+
 # Try to read input file
 try:
     print(f"\n📋 Reading companies from: {INPUT_FILE}")
-    df = pd.read_excel(INPUT_FILE)
+    df = _read_input(INPUT_FILE)
     print(f"✅ Found {len(df)} companies\n")
 except FileNotFoundError:
     print(f"❌ File not found: {INPUT_FILE}")
     print("\n💡 Available Excel files in parent directory:")
-    import os
     for f in os.listdir('..'):
         if f.endswith('.xlsx'):
             print(f"   - {f}")
@@ -34,124 +121,228 @@ except Exception as e:
     exit(1)
 
 # Process companies
-results = []
+# Companies run concurrently (network-bound); a per-host lock keeps any one
+# server at a single in-flight scrape, which replaces the fixed 5s sleep
+MAX_WORKERS = 8
+
 successful = 0
 failed = 0
 
 start_time = datetime.now()
 
-for idx, row in df.iterrows():
-    company = row.get('Name', row.get('name', 'Unknown'))
-    website = row.get('Website', row.get('website', row.get('url', '')))
+
+# Accepted input columns, in priority order
+_NAME_COLUMNS = ('Name', 'name')
+_WEBSITE_COLUMNS = ('Website', 'website', 'url')
+
+
+def _column_values(*names, default=''):
+    """First existing column as a plain list (one conversion, no per-row Series)."""
+    for name in names:
+        if name in df.columns:
+            return df[name].tolist()
+    return [default] * len(df)
+
+
+_HOST_LOCKS = {}
+_HOST_LOCKS_GUARD = threading.Lock()
+
+
+def _split_website(website):
+    w = str(website).strip()
+    return urlsplit(w if "://" in w else "http://" + w)
+
+
+def _normalized_host(parts):
+    """Host as both the lock and the memo key see it (lowercase, no www.)."""
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+def _host_lock(website):
+    # Same normalized host as _website_key: a.com and www.a.com share one lock,
+    # so a duplicate waits for (and then reuses) the first scrape
+    host = _normalized_host(_split_website(website))
+    with _HOST_LOCKS_GUARD:
+        lock = _HOST_LOCKS.get(host)
+        if lock is None:
+            lock = _HOST_LOCKS[host] = threading.Lock()
+    return lock
+
+
+def _website_key(website):
+    """Same site -> same key: scheme, www., query, fragment and trailing '/' ignored."""
+    parts = _split_website(website)
+    return _normalized_host(parts) + parts.path.rstrip("/")
+
+
+# Enrichment results per website: rows sharing a site (branches, franchises,
+# duplicate entries) reuse the first scrape. Filled under the host lock, so a
+# duplicate waiting on that lock finds the result instead of scraping again.
+_RESULTS_BY_WEBSITE = {}
+
+
+def _enrich(company, website):
+    key = _website_key(website)
+    with _host_lock(website):
+        result = _RESULTS_BY_WEBSITE.get(key)
+        if result is None:
+            # Run scraping with agent
+            result = _RESULTS_BY_WEBSITE[key] = run_case2_enrichment(
+                company_name=company,
+                website_url=str(website),
+                use_agent=True
+            )
+    return result
+
+
+# Output schema: rows are tuples in this order, stored column-wise
+OUTPUT_COLS = (
+    'Company',
+    'Website',
+    'Leadership Found',
+    'Total Leaders',
+    'CEO Name',
+    'CEO Role',
+    'Leader 1',
+    'Leader 2',
+    'Leader 3',
+    'Leader 4',
+    'Leader 5',
+)
+_FOUND_IDX = OUTPUT_COLS.index('Leadership Found')
+_TOTAL_IDX = OUTPUT_COLS.index('Total Leaders')
+
+
+def _empty_row(company, website, leadership_found):
+    return (company, website, leadership_found, 0, '', '', '', '', '', '', '')
+
+
+def _process(company, website):
+    """Scrape one company (worker thread) -> result row tuple (OUTPUT_COLS order)."""
+    result = _enrich(company, website)
     
-    # Skip if no website
-    if not website or str(website).strip() == '' or str(website).lower() == 'nan':
-        print(f"\n[{idx+1}/{len(df)}] ⏭️  Skipping {company} - No website")
-        results.append({
-            'Company': company,
-            'Website': '',
-            'Leadership Found': 'No',
-            'Total Leaders': 0,
-            'CEO Name': '',
-            'CEO Role': '',
-            'Leader 1': '',
-            'Leader 2': '',
-            'Leader 3': '',
-            'Leader 4': '',
-            'Leader 5': '',
-        })
-        continue
+    # Extract data
+    leadership_found = result.get('Leadership Found', 'No')
+    leaders = result.get('case2_leaders', [])
+    management = result.get('case2_management', {})
     
-    print(f"\n{'='*80}")
-    print(f"[{idx+1}/{len(df)}] Processing: {company}")
-    print(f"Website: {website}")
-    print(f"{'='*80}")
+    # Get CEO
+    ceo_data = management.get('Executive Leadership', {})
+    ceo_name = ceo_data.get('name', '')
+    ceo_role = ceo_data.get('designation', '')
     
-    try:
-        # Run scraping with agent
-        result = run_case2_enrichment(
-            company_name=company,
-            website_url=str(website),
-            use_agent=True
-        )
-        
-        # Extract data
-        leadership_found = result.get('Leadership Found', 'No')
-        leaders = result.get('case2_leaders', [])
-        management = result.get('case2_management', {})
-        
-        # Get CEO
-        ceo_data = management.get('Executive Leadership', {})
-        ceo_name = ceo_data.get('name', '')
-        ceo_role = ceo_data.get('designation', '')
+    # Top 5 leaders, padded to 5 cells
+    top = [f"{leader.get('name', '')} - {leader.get('role', '')}" for leader in leaders[:5]]
+    top += [''] * (5 - len(top))
+    
+    return (company, website, leadership_found, len(leaders), ceo_name, ceo_role, *top)
+
+
+companies = _column_values(*_NAME_COLUMNS, default='Unknown')
+websites = _column_values(*_WEBSITE_COLUMNS)
+
+# Preallocated columns (filled by input index, so order survives as_completed);
+# the DataFrame takes them as-is instead of transposing a list of row dicts
+columns = [[''] * len(df) for _ in OUTPUT_COLS]
+
+
+output_file = f'case2_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
+
+# Crash-safe checkpoint: every finished row is appended (line-buffered) as soon
+# as it completes, so a long batch that dies midway keeps what it already did.
+# Rows land in completion order, so each carries its input row index (df index)
+checkpoint_file = output_file.replace('.xlsx', '.partial.csv')
+checkpoint = open(checkpoint_file, 'w', newline='', encoding='utf-8', buffering=1)
+checkpoint_writer = csv.writer(checkpoint)
+checkpoint_writer.writerow(('Input Index', *OUTPUT_COLS))
+
+
+def _store_row(idx, row):
+    for col, value in zip(columns, row):
+        col[idx] = value
+    checkpoint_writer.writerow((idx, *row))
+
+
+with checkpoint, ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+    futures = {}
+    for idx, (company, website) in enumerate(zip(companies, websites)):
+        # Skip if no website
+        if not website or str(website).strip() == '' or str(website).lower() == 'nan':
+            print(f"\n[{idx+1}/{len(df)}] ⏭️  Skipping {company} - No website")
+            _store_row(idx, _empty_row(company, '', 'No'))
+            continue
+        futures[pool.submit(_process, company, website)] = (idx, company, website)
+    
+    for future in as_completed(futures):
+        idx, company, website = futures[future]
         
-        # Build result row
-        row_data = {
-            'Company': company,
-            'Website': website,
-            'Leadership Found': leadership_found,
-            'Total Leaders': len(leaders),
-            'CEO Name': ceo_name,
-            'CEO Role': ceo_role,
-        }
+        print(f"\n{'='*80}")
+        print(f"[{idx+1}/{len(df)}] Processed: {company}")
+        print(f"Website: {website}")
+        print(f"{'='*80}")
         
-        # Add top 5 leaders
-        for i in range(5):
-            if i < len(leaders):
-                leader = leaders[i]
-                row_data[f'Leader {i+1}'] = f"{leader.get('name', '')} - {leader.get('role', '')}"
+        try:
+            row = future.result()
+            _store_row(idx, row)
+            
+            if row[_FOUND_IDX] == 'Yes':
+                successful += 1
+                print(f"✅ Success! Found {row[_TOTAL_IDX]} leaders")
             else:
-                row_data[f'Leader {i+1}'] = ''
-        
-        results.append(row_data)
-        
-        if leadership_found == 'Yes':
-            successful += 1
-            print(f"✅ Success! Found {len(leaders)} leaders")
-        else:
+                failed += 1
+                print(f"⚠️ No leaders found")
+                
+        except Exception as e:
+            print(f"❌ Error: {e}")
             failed += 1
-            print(f"⚠️ No leaders found")
-        
-        # Small delay between requests (be nice to servers)
-        if idx < len(df) - 1:
-            print("⏳ Waiting 5 seconds...")
-            time.sleep(5)
-            
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        failed += 1
-        
-        results.append({
-            'Company': company,
-            'Website': website,
-            'Leadership Found': 'Error',
-            'Total Leaders': 0,
-            'CEO Name': '',
-            'CEO Role': '',
-            'Leader 1': '',
-            'Leader 2': '',
-            'Leader 3': '',
-            'Leader 4': '',
-            'Leader 5': '',
-        })
+            _store_row(idx, _empty_row(company, website, 'Error'))
 
 # Save results
 print("\n" + "="*80)
 print("💾 SAVING RESULTS")
 print("="*80)
 
-output_file = f'case2_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
 
+def _xlsx_value(v):
+    # Blank strings / NaN become empty cells (same as DataFrame.to_excel)
+    if v == '' or (isinstance(v, float) and v != v):
+        return None
+    return v
+
+
+def _write_xlsx(path):
+    """Stream rows straight from the columns (write-only workbook, no cell grid)."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append(OUTPUT_COLS)
+    for row in zip(*columns):
+        ws.append([_xlsx_value(v) for v in row])
+    wb.save(path)
+
+
+saved = True
 try:
-    output_df = pd.DataFrame(results)
-    output_df.to_excel(output_file, index=False)
+    _write_xlsx(output_file)
     print(f"✅ Results saved to: {output_file}")
 except Exception as e:
     print(f"❌ Error saving Excel: {e}")
     # Try saving as CSV
     csv_file = output_file.replace('.xlsx', '.csv')
-    output_df.to_csv(csv_file, index=False)
-    print(f"✅ Saved as CSV instead: {csv_file}")
+    try:
+        pd.DataFrame(dict(zip(OUTPUT_COLS, columns))).to_csv(csv_file, index=False)
+        print(f"✅ Saved as CSV instead: {csv_file}")
+    except Exception as e:
+        saved = False
+        print(f"❌ Error saving CSV: {e}")
+
+# Results are safely saved -> the checkpoint has served its purpose
+if saved:
+    os.remove(checkpoint_file)
+else:
+    print(f"📝 Rows kept in checkpoint: {checkpoint_file}")
 
 # Print summary
 end_time = datetime.now()
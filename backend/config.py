@@ -5,32 +5,45 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import os
+from functools import lru_cache
+from typing import Dict
 
 
 # ---------------------------------------------------------
 # Helper functions for environment variables
 # ---------------------------------------------------------
+@lru_cache(maxsize=1)
+def _load_env() -> Dict[str, str]:
+    """One plain-dict snapshot of the environment (after .env is loaded).
+    Every setting below reads from it instead of os.environ's per-key
+    encode/decode lookups."""
+    return dict(os.environ)
+
+
 def _env_int(key: str, default: int) -> int:
     try:
-        return int(str(os.getenv(key, default)).strip())
+        return int(str(_load_env().get(key, default)).strip())
     except Exception:
         return default
 
 
 def _env_float(key: str, default: float) -> float:
     try:
-        return float(str(os.getenv(key, default)).strip())
+        return float(str(_load_env().get(key, default)).strip())
     except Exception:
         return default
 
 
+_TRUE_VALUES = frozenset({"true", "1", "yes", "y"})
+
+
 def _env_bool(key: str, default: bool = False) -> bool:
-    return str(os.getenv(key, str(default))).strip().lower() in {"true", "1", "yes", "y"}
+    return str(_load_env().get(key, str(default))).strip().lower() in _TRUE_VALUES
 
 
 def _env_str(key: str, default: str = "") -> str:
     try:
-        return str(os.getenv(key, default) or default).strip()
+        return str(_load_env().get(key, default) or default).strip()
     except Exception:
         return default
 
@@ -76,6 +89,9 @@ TOP_N_CAP = _env_int("TOP_N_CAP", 300)
 # Google Places API key
 GOOGLE_PLACES_API_KEY = _env_str("GOOGLE_PLACES_API_KEY", "")
 
+# Raw Places dumps are machine-read; set True only when a human needs to read them
+RAW_JSON_PRETTY = _env_bool("RAW_JSON_PRETTY", False)
+
 
 # ---------------------------------------------------------
 # Case 2: Leadership Extraction (Scraping-first)
@@ -88,6 +104,13 @@ CASE2_MAX_LEADERS = _env_int("CASE2_MAX_LEADERS", 5)
 # Per-company timeout seconds (default ~25s)
 CASE2_TIMEOUT_SECS = _env_int("CASE2_TIMEOUT_SECS", 25)
 
+# Companies scraped concurrently (thread pool + HTTP connection pool size)
+CASE2_MAX_WORKERS = _env_int("CASE2_MAX_WORKERS", 16)
+
+# Case-2 result cache freshness (hours) + local fallback store when backend.db is unavailable
+CASE2_CACHE_TTL_HOURS = _env_int("CASE2_CACHE_TTL_HOURS", 72)
+CASE2_CACHE_PATH = _env_str("CASE2_CACHE_PATH", os.path.join("~", ".cache", "case2.sqlite"))
+
 # (Legacy) Max pages to try (older scraper used this)
 CASE2_MAX_PAGES = _env_int("CASE2_MAX_PAGES", 8)
 
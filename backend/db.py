@@ -1,26 +1,123 @@
 from __future__ import annotations
 
 import sqlite3
+import hashlib
 import json
+import queue
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Optional fast JSON (cache payloads + per-row Case-2 columns); stdlib fallback
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any, sort_keys: bool = False) -> str:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option).decode("utf-8")
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any, sort_keys: bool = False) -> str:
+        return json.dumps(obj, sort_keys=sort_keys, ensure_ascii=False)
+
+    ORJSON_AVAILABLE = False
 
 # Database Path Configuration
 DB_PATH = Path(__file__).parent.parent / "data" / "db.sqlite3"
 DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
 
+# Per-connection tuning: WAL needs no fsync of the main file per commit (and
+# lets readers run alongside a writer); NORMAL is crash-safe under WAL.
+_CONN_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA mmap_size=268435456;"
+    "PRAGMA cache_size=-65536;"
+)
+
+# journal_mode=WAL is stored in the DB file itself -> switch once per path
+_wal_paths: set = set()
+
+
 def get_conn() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH)
+    """New tuned connection; the caller owns it and closes it."""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    if DB_PATH not in _wal_paths:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _wal_paths.add(DB_PATH)
+    conn.executescript(_CONN_PRAGMAS)
     return conn
 
 
+# Reused connections for the helpers below (connect + PRAGMAs once, not per
+# call). LIFO hands back the most recently used, i.e. warmest, connection.
+# A borrowed connection belongs to one caller until returned, so sharing them
+# across threads is safe (hence check_same_thread=False above).
+_POOL_SIZE = 8
+_pool: "queue.LifoQueue[Tuple[Path, sqlite3.Connection]]" = queue.LifoQueue(maxsize=_POOL_SIZE)
+
+
+@contextmanager
+def borrow() -> Iterator[sqlite3.Connection]:
+    try:
+        path, conn = _pool.get_nowait()
+        if path != DB_PATH:  # DB_PATH was repointed -> stale connection
+            conn.close()
+            path, conn = DB_PATH, get_conn()
+    except queue.Empty:
+        path, conn = DB_PATH, get_conn()
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:  # never pool a half-done transaction
+            conn.rollback()
+        try:
+            _pool.put_nowait((path, conn))
+        except queue.Full:
+            conn.close()
+
+
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _now_epoch_us() -> int:
+    return time.time_ns() // 1000
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+
+def _iso_to_epoch_us(v: str) -> Optional[int]:
+    """Legacy ISO business.timestamp -> epoch microseconds (naive = UTC)."""
+    dt = _parse_iso(v)
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _ONE_US
+
+
+def _epoch_us_to_iso(v: Any) -> Optional[str]:
+    """Stored business.timestamp -> ISO string (the format readers always got).
+    Columns declared TEXT on older DBs hand the int back as a digit string."""
+    try:
+        us = int(v)
+    except (TypeError, ValueError):
+        return v  # NULL, or a value the migration couldn't parse: as stored
+    return (_EPOCH + us * _ONE_US).isoformat()
+
+
 def _parse_iso(dt: str) -> Optional[datetime]:
     try:
         return datetime.fromisoformat(dt)
@@ -29,8 +126,9 @@ def _parse_iso(dt: str) -> Optional[datetime]:
 
 
 def _norm_text(x: Any) -> str:
-    s = "" if x is None else str(x)
-    return " ".join(s.strip().split())
+    if type(x) is not str:  # almost always a str already -> no str() copy
+        x = "" if x is None else str(x)
+    return " ".join(x.split())  # split() also drops edge whitespace
 
 
 def _norm_email(x: Any) -> str:
@@ -50,7 +148,7 @@ def _safe_json_load(x: Any) -> Any:
         if not s:
             return None
         try:
-            return json.loads(s)
+            return _json_loads(s)
         except Exception:
             return None
     return None
@@ -232,18 +330,30 @@ def _has_any_management(mgmt: Dict[str, Dict[str, str]]) -> bool:
 
 
 def _table_columns(conn: sqlite3.Connection, table: str) -> List[str]:
-    cur = conn.cursor()
-    cur.execute(f"PRAGMA table_info({table})")
-    cols = [r[1] for r in cur.fetchall()]  # type: ignore[index]
-    return cols
+    return [r[1] for r in conn.execute(f"PRAGMA table_info({table})")]
 
 
-def _ensure_column(conn: sqlite3.Connection, table: str, col: str, col_def: str) -> None:
-    cols = _table_columns(conn, table)
-    if col in cols:
-        return
-    cur = conn.cursor()
-    cur.execute(f"ALTER TABLE {table} ADD COLUMN {col} {col_def}")
+def _ensure_columns(conn: sqlite3.Connection, table: str, cols: Dict[str, str]) -> None:
+    """Add any missing {column: definition}; one PRAGMA pass for the whole set."""
+    existing = set(_table_columns(conn, table))
+    for col, col_def in cols.items():
+        if col not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {col} {col_def}")
+
+
+# Columns added after the first release (older DBs get them via init_db)
+_BUSINESS_MIGRATIONS: Dict[str, str] = {
+    "contact_email": "TEXT",
+    "case2_leaders_json": "TEXT",
+    "case2_management_json": "TEXT",
+    "query_tag": "TEXT",
+    "timestamp": "INTEGER",
+    "place_id": "TEXT",
+    "address": "TEXT",
+    "source_url": "TEXT",
+    "rating_count": "INTEGER",
+    "google_rating": "REAL",
+}
 
 
 def init_db() -> None:
@@ -251,80 +361,108 @@ def init_db() -> None:
     Initializes the database schema with Case-2 bucket support.
     Safe for existing DBs (adds missing columns).
     """
-    conn = get_conn()
-    cur = conn.cursor()
-
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS search_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            query TEXT NOT NULL,
-            created_at TEXT NOT NULL
+    with borrow() as conn:
+        cur = conn.cursor()
+
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS search_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                query TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+            """
         )
-        """
-    )
 
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS cached_results (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            cache_key TEXT NOT NULL,
-            result_type TEXT NOT NULL,
-            result_json TEXT NOT NULL,
-            created_at TEXT NOT NULL
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cached_results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                cache_key TEXT NOT NULL,
+                result_type TEXT NOT NULL,
+                result_json TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+            """
         )
-        """
-    )
 
-    # Core business table
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS business (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            company_name TEXT,
-            industry TEXT,
-            website_url TEXT UNIQUE,
-            has_website INTEGER,
-            google_rating REAL,
-            rating_count INTEGER,
-            contact_phone TEXT,
-            contact_email TEXT,
-            case2_leaders_json TEXT,          -- legacy list
-            case2_management_json TEXT,       -- ✅ bucket dict
-            query_tag TEXT,
-            timestamp TEXT,
-            place_id TEXT,
-            address TEXT,
-            source_url TEXT
+        # Core business table
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS business (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                company_name TEXT,
+                industry TEXT,
+                website_url TEXT UNIQUE,
+                has_website INTEGER,
+                google_rating REAL,
+                rating_count INTEGER,
+                contact_phone TEXT,
+                contact_email TEXT,
+                case2_leaders_json TEXT,          -- legacy list
+                case2_management_json TEXT,       -- ✅ bucket dict
+                query_tag TEXT,
+                timestamp INTEGER,               -- unix epoch microseconds (UTC)
+                place_id TEXT,
+                address TEXT,
+                source_url TEXT
+            )
+            """
         )
-        """
-    )
 
-    # Safe migrations (older DBs)
-    try:
-        _ensure_column(conn, "business", "contact_email", "TEXT")
-        _ensure_column(conn, "business", "case2_leaders_json", "TEXT")
-        _ensure_column(conn, "business", "case2_management_json", "TEXT")
-        _ensure_column(conn, "business", "query_tag", "TEXT")
-        _ensure_column(conn, "business", "timestamp", "TEXT")
-        _ensure_column(conn, "business", "place_id", "TEXT")
-        _ensure_column(conn, "business", "address", "TEXT")
-        _ensure_column(conn, "business", "source_url", "TEXT")
-        _ensure_column(conn, "business", "rating_count", "INTEGER")
-        _ensure_column(conn, "business", "google_rating", "REAL")
-    except Exception:
-        pass
-
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_cached_cachekey ON cached_results(cache_key)")
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_business_querytag ON business(query_tag)")
+        # Safe migrations (older DBs)
+        try:
+            _ensure_columns(conn, "business", _BUSINESS_MIGRATIONS)
+        except Exception:
+            pass
+
+        # One row per (cache_key, result_type): older DBs appended a row per
+        # save, so keep only the newest of each pair before adding the key
+        has_unique = cur.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_cached_key_type'"
+        ).fetchone()
+        if not has_unique:
+            cur.execute(
+                """
+                DELETE FROM cached_results WHERE id NOT IN (
+                    SELECT MAX(id) FROM cached_results GROUP BY cache_key, result_type
+                )
+                """
+            )
+            cur.execute("CREATE UNIQUE INDEX idx_cached_key_type ON cached_results(cache_key, result_type)")
+        # the unique index's cache_key prefix covers the old single-column index
+        cur.execute("DROP INDEX IF EXISTS idx_cached_cachekey")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_business_querytag ON business(query_tag)")
+
+        # v1: business.timestamp holds epoch microseconds; convert legacy ISO rows once
+        if cur.execute("PRAGMA user_version").fetchone()[0] < 1:
+            legacy = cur.execute(
+                "SELECT id, timestamp FROM business WHERE typeof(timestamp) = 'text' AND timestamp GLOB '*-*'"
+            ).fetchall()
+            converted = [(_iso_to_epoch_us(ts), rid) for rid, ts in legacy]
+            cur.executemany(
+                "UPDATE business SET timestamp = ? WHERE id = ?",
+                [(us, rid) for us, rid in converted if us is not None],
+            )
+            cur.execute("PRAGMA user_version = 1")
 
-    conn.commit()
-    conn.close()
+        conn.commit()
 
 
 # -----------------------------
 # Generic Caching & History
 # -----------------------------
+# Hot-path SQL kept as constants: one string per statement, so sqlite3's
+# statement cache is hit on every call instead of re-preparing.
+_SQL_UPSERT_CACHE = (
+    "INSERT INTO cached_results (cache_key, result_type, result_json, created_at) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT(cache_key, result_type) DO UPDATE SET "
+    "result_json = excluded.result_json, created_at = excluded.created_at"
+)
+_SQL_SELECT_CACHE = "SELECT result_json, created_at FROM cached_results WHERE cache_key = ? AND result_type = ?"
+_SQL_INSERT_HISTORY = "INSERT INTO search_history (query, created_at) VALUES (?, ?)"
+
+
 def make_cache_key(query: str, location: str = "", place: str = "", top_n: int = 0, case2_enabled: bool = False) -> str:
     payload = {
         "query": _norm_text(query).lower(),
@@ -333,29 +471,20 @@ def make_cache_key(query: str, location: str = "", place: str = "", top_n: int =
         "top_n": int(top_n or 0),
         "case2_enabled": bool(case2_enabled),
     }
-    return json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    # fixed 32-char digest of the canonical JSON: short, uniform index keys
+    canonical = _json_dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
 
 
 def cache_results(cache_key: str, result_type: str, results: Any) -> None:
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT INTO cached_results (cache_key, result_type, result_json, created_at) VALUES (?, ?, ?, ?)",
-        (cache_key, result_type, json.dumps(results, ensure_ascii=False), _now_iso()),
-    )
-    conn.commit()
-    conn.close()
+    with borrow() as conn:
+        conn.execute(_SQL_UPSERT_CACHE, (cache_key, result_type, _json_dumps(results), _now_iso()))
+        conn.commit()
 
 
 def get_cached_results(cache_key: str, result_type: str) -> Optional[Any]:
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        "SELECT result_json FROM cached_results WHERE cache_key = ? AND result_type = ? ORDER BY id DESC LIMIT 1",
-        (cache_key, result_type),
-    )
-    row = cur.fetchone()
-    conn.close()
+    with borrow() as conn:
+        row = conn.execute(_SQL_SELECT_CACHE, (cache_key, result_type)).fetchone()
     if not row:
         return None
     return _safe_json_load(row["result_json"])
@@ -377,20 +506,8 @@ def get_case2_cache(cache_key: str, ttl_hours: int = 72) -> Optional[Dict[str, A
     if not cache_key:
         return None
 
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT result_json, created_at
-        FROM cached_results
-        WHERE cache_key = ? AND result_type = ?
-        ORDER BY id DESC
-        LIMIT 1
-        """,
-        (cache_key, CASE2_CACHE_TYPE),
-    )
-    row = cur.fetchone()
-    conn.close()
+    with borrow() as conn:
+        row = conn.execute(_SQL_SELECT_CACHE, (cache_key, CASE2_CACHE_TYPE)).fetchone()
 
     if not row:
         return None
@@ -420,6 +537,61 @@ def make_case2_cache_key(place_id: str = "", website_url: str = "") -> str:
 # -----------------------------
 # Data Insertion Logic
 # -----------------------------
+_SQL_UPSERT_BUSINESS = """
+    INSERT INTO business (
+        company_name, industry, website_url, has_website,
+        google_rating, rating_count, contact_phone, contact_email,
+        case2_leaders_json, case2_management_json,
+        query_tag, timestamp,
+        place_id, address, source_url
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(website_url) DO UPDATE SET
+        company_name=excluded.company_name,
+        industry=excluded.industry,
+        has_website=excluded.has_website,
+        google_rating=excluded.google_rating,
+        rating_count=excluded.rating_count,
+        contact_phone=excluded.contact_phone,
+        contact_email=excluded.contact_email,
+        case2_leaders_json=excluded.case2_leaders_json,
+        case2_management_json=excluded.case2_management_json,
+        query_tag=excluded.query_tag,
+        timestamp=excluded.timestamp,
+        place_id=excluded.place_id,
+        address=excluded.address,
+        source_url=excluded.source_url
+"""
+_SQL_SELECT_BUSINESS_BY_TAG = "SELECT * FROM business WHERE query_tag = ? ORDER BY id DESC"
+
+# Stored JSON for a business without any leaders
+_EMPTY_MGMT_JSON = _json_dumps(_empty_case2_management())
+_EMPTY_LEADERS_JSON = _json_dumps([])
+
+# Accepted input aliases per field, in priority order
+_NAME_KEYS = ("Company Name", "company_name", "name")
+_WEBSITE_KEYS = ("Website URL", "website_url", "website")
+_INDUSTRY_KEYS = ("Industry", "industry")
+_RATING_KEYS = ("Google Rating", "google_rating", "rating")
+# ✅ FINAL KEY: Rating Count (but accept old keys too)
+_RATING_COUNT_KEYS = ("Rating Count", "rating_count", "Reviews", "userRatingCount", "google_rating_count")
+_PHONE_KEYS = ("Contact Phone", "phone", "Phone")
+_EMAIL_KEYS = ("Contact Email", "email")
+_PLACE_ID_KEYS = ("Place ID", "google_place_id", "place_id", "id")
+_ADDRESS_KEYS = ("Address", "formattedAddress", "address")
+_SOURCE_URL_KEYS = ("Source URL", "googleMapsUri", "url")
+_LEADERS_KEYS = ("case2_leaders", "leaders", "case2_leaders_json")
+
+
+def _first(d: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """Same as d.get(k1) or d.get(k2) or ... (last lookup if none is truthy)."""
+    v = None
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return v
+
+
 def insert_business_list(business_list: List[Dict[str, Any]], query_tag: str) -> None:
     """
     Stores Case-2 in bucket format (case2_management_json).
@@ -428,40 +600,32 @@ def insert_business_list(business_list: List[Dict[str, Any]], query_tag: str) ->
     if not business_list:
         return
 
-    conn = get_conn()
-    cur = conn.cursor()
-    ts = _now_iso()
+    ts = _now_epoch_us()
+    rows: List[tuple] = []
 
     for b in business_list:
-        name = _norm_text(b.get("Company Name") or b.get("company_name") or b.get("name") or "Unknown")
+        name = _norm_text(_first(b, _NAME_KEYS) or "Unknown")
 
-        web_raw = b.get("Website URL") or b.get("website_url") or b.get("website") or ""
-        web = _norm_text(web_raw)
+        web = _norm_text(_first(b, _WEBSITE_KEYS) or "")
         website_url = web if web else None  # NULL if missing
 
-        industry = _norm_text(b.get("Industry") or b.get("industry") or "Business")
-        rating = b.get("Google Rating") or b.get("google_rating") or b.get("rating")
+        industry = _norm_text(_first(b, _INDUSTRY_KEYS) or "Business")
+        rating = _first(b, _RATING_KEYS)
+        rating_count = _first(b, _RATING_COUNT_KEYS)
 
-        # ✅ FINAL KEY: Rating Count (but accept old keys too)
-        rating_count = (
-            b.get("Rating Count")
-            or b.get("rating_count")
-            or b.get("Reviews")
-            or b.get("userRatingCount")
-            or b.get("google_rating_count")
-        )
-
-        phone = _norm_text(b.get("Contact Phone") or b.get("phone") or b.get("Phone") or "")
-        email = _norm_email(b.get("Contact Email") or b.get("email") or "")
+        phone = _norm_text(_first(b, _PHONE_KEYS) or "")
+        email = _norm_email(_first(b, _EMAIL_KEYS) or "")
 
-        place_id = _norm_text(b.get("Place ID") or b.get("google_place_id") or b.get("place_id") or b.get("id") or "")
-        address = _norm_text(b.get("Address") or b.get("formattedAddress") or b.get("address") or "")
-        source_url = _norm_text(b.get("Source URL") or b.get("googleMapsUri") or b.get("url") or "")
+        place_id = _norm_text(_first(b, _PLACE_ID_KEYS) or "")
+        address = _norm_text(_first(b, _ADDRESS_KEYS) or "")
+        source_url = _norm_text(_first(b, _SOURCE_URL_KEYS) or "")
 
-        # normalize rating_count
+        # normalize rating_count (numbers skip the str round-trip)
         try:
             if rating_count in (None, "", "null", "None"):
                 rating_count = None
+            elif type(rating_count) in (int, float):
+                rating_count = int(rating_count)
             else:
                 rating_count = int(float(str(rating_count).replace(",", "").strip()))
         except Exception:
@@ -471,6 +635,8 @@ def insert_business_list(business_list: List[Dict[str, Any]], query_tag: str) ->
         try:
             if rating in (None, "", "null", "None"):
                 rating = None
+            elif type(rating) in (int, float):
+                rating = float(rating)
             else:
                 rating = float(str(rating).replace(",", "").strip())
         except Exception:
@@ -482,18 +648,11 @@ def insert_business_list(business_list: List[Dict[str, Any]], query_tag: str) ->
 
         # fallback: leaders list -> buckets
         if not _has_any_management(mgmt):
-            leaders_raw = (
-                b.get("case2_leaders")
-                or b.get("leaders")
-                or b.get("case2_leaders_json")
-                or []
-            )
+            leaders_raw = _first(b, _LEADERS_KEYS) or []
             leaders = _norm_leaders_list(leaders_raw, max_leaders=5)
             if leaders:
                 mgmt = _leaders_to_case2_management(leaders)
 
-        case2_management_json = json.dumps(mgmt, ensure_ascii=False)
-
         # legacy list derived from mgmt
         legacy_list: List[Dict[str, str]] = []
         for buck in BUCKETS:
@@ -502,87 +661,50 @@ def insert_business_list(business_list: List[Dict[str, Any]], query_tag: str) ->
             dg = _norm_text(d.get("designation", ""))
             if nm and dg:
                 legacy_list.append({"name": nm, "role": dg})
-        case2_leaders_json = json.dumps(legacy_list, ensure_ascii=False)
 
-        try:
-            if website_url is not None:
-                cur.execute(
-                    """
-                    INSERT INTO business (
-                        company_name, industry, website_url, has_website,
-                        google_rating, rating_count, contact_phone, contact_email,
-                        case2_leaders_json, case2_management_json,
-                        query_tag, timestamp,
-                        place_id, address, source_url
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(website_url) DO UPDATE SET
-                        company_name=excluded.company_name,
-                        industry=excluded.industry,
-                        has_website=excluded.has_website,
-                        google_rating=excluded.google_rating,
-                        rating_count=excluded.rating_count,
-                        contact_phone=excluded.contact_phone,
-                        contact_email=excluded.contact_email,
-                        case2_leaders_json=excluded.case2_leaders_json,
-                        case2_management_json=excluded.case2_management_json,
-                        query_tag=excluded.query_tag,
-                        timestamp=excluded.timestamp,
-                        place_id=excluded.place_id,
-                        address=excluded.address,
-                        source_url=excluded.source_url
-                    """,
-                    (
-                        name,
-                        industry,
-                        website_url,
-                        1,
-                        rating,
-                        rating_count,
-                        phone,
-                        email,
-                        case2_leaders_json,
-                        case2_management_json,
-                        query_tag,
-                        ts,
-                        place_id,
-                        address,
-                        source_url,
-                    ),
-                )
-            else:
-                cur.execute(
-                    """
-                    INSERT INTO business (
-                        company_name, industry, website_url, has_website,
-                        google_rating, rating_count, contact_phone, contact_email,
-                        case2_leaders_json, case2_management_json,
-                        query_tag, timestamp,
-                        place_id, address, source_url
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        name,
-                        industry,
-                        None,
-                        0,
-                        rating,
-                        rating_count,
-                        phone,
-                        email,
-                        case2_leaders_json,
-                        case2_management_json,
-                        query_tag,
-                        ts,
-                        place_id,
-                        address,
-                        source_url,
-                    ),
-                )
-        except Exception as e:
-            print(f"[DB_ERR] Failed to insert/update {name}: {e}")
+        # no leaders (the common case) -> both columns are constants, skip dumps
+        if legacy_list:
+            case2_management_json = _json_dumps(mgmt)
+            case2_leaders_json = _json_dumps(legacy_list)
+        else:
+            case2_management_json = _EMPTY_MGMT_JSON
+            case2_leaders_json = _EMPTY_LEADERS_JSON
+
+        rows.append((
+            name,
+            industry,
+            website_url,
+            1 if website_url is not None else 0,
+            rating,
+            rating_count,
+            phone,
+            email,
+            case2_leaders_json,
+            case2_management_json,
+            query_tag,
+            ts,
+            place_id,
+            address,
+            source_url,
+        ))
 
-    conn.commit()
-    conn.close()
+    # One transaction + executemany: the statement is prepared once for the whole
+    # list. Rows without a website go through the same upsert -- NULL never
+    # conflicts on the UNIQUE website_url, so for them it is a plain INSERT.
+    with borrow() as conn:
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(_SQL_UPSERT_BUSINESS, rows)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            # a bad row fails the whole batch -> redo row by row so only it is lost
+            for row in rows:
+                try:
+                    conn.execute(_SQL_UPSERT_BUSINESS, row)
+                except Exception as e:
+                    print(f"[DB_ERR] Failed to insert/update {row[0]}: {e}")
+            conn.commit()
 
 
 def fetch_businesses_by_query(query_tag: str) -> List[Dict[str, Any]]:
@@ -591,15 +713,13 @@ def fetch_businesses_by_query(query_tag: str) -> List[Dict[str, Any]]:
       - includes case2_management (bucket dict)
       - exposes FINAL keys: Rating Count (not Reviews)
     """
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM business WHERE query_tag = ? ORDER BY id DESC", (query_tag,))
-    rows = cur.fetchall()
-    conn.close()
+    with borrow() as conn:
+        rows = conn.execute(_SQL_SELECT_BUSINESS_BY_TAG, (query_tag,)).fetchall()
 
     out: List[Dict[str, Any]] = []
     for r in rows:
         d = dict(r)
+        d["timestamp"] = _epoch_us_to_iso(d.get("timestamp"))
 
         d["Company Name"] = _norm_text(d.get("company_name") or "Unknown")
         d["Industry"] = _norm_text(d.get("industry") or "Business")
@@ -627,15 +747,13 @@ def fetch_businesses_by_query(query_tag: str) -> List[Dict[str, Any]]:
 
         d["case2_management"] = mgmt
 
-        # optional list view too (for any old code)
-        leaders_list: List[Dict[str, str]] = []
-        for buck in BUCKETS:
-            x = mgmt.get(buck) or {}
-            nm = _norm_text(x.get("name", ""))
-            dg = _norm_text(x.get("designation", ""))
-            if nm and dg:
-                leaders_list.append({"name": nm, "role": dg})
-        d["case2_leaders"] = leaders_list
+        # optional list view too (for any old code); mgmt is canonical here
+        # (normalized, name/designation both set or both empty) -> no re-norm
+        d["case2_leaders"] = [
+            {"name": x["name"], "role": x["designation"]}
+            for x in (mgmt[b] for b in BUCKETS)
+            if x["name"]
+        ]
 
         out.append(d)
 
@@ -643,14 +761,9 @@ def fetch_businesses_by_query(query_tag: str) -> List[Dict[str, Any]]:
 
 
 def add_search_history(query: str) -> None:
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT INTO search_history (query, created_at) VALUES (?, ?)",
-        (_norm_text(query), _now_iso()),
-    )
-    conn.commit()
-    conn.close()
+    with borrow() as conn:
+        conn.execute(_SQL_INSERT_HISTORY, (_norm_text(query), _now_iso()))
+        conn.commit()
 # --- 💡 NEW: FLAT LEADERSHIP TABLE SAVE ---
 
 def save_leaders_to_db(conn: sqlite3.Connection, company_url: str, leaders: List[Any]):
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from typing import List, Dict, Any
+import io
 import re
 import json
 
-import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from openpyxl.utils import get_column_letter
 
@@ -17,26 +19,34 @@ def _norm(s: Any) -> str:
     return re.sub(r"\s+", " ", s.strip())
 
 
+# Built once (not per call)
+_MISSING_VALUES = frozenset({"", "null", "N/A", "na", "None", "NULL"})
+_YES_VALUES = frozenset({"yes", "true", "1", "y"})
+_BLANK_NUMBER_VALUES = frozenset({"nan", "none", "null"})
+
+
 def _pick(row: Dict[str, Any], *keys: str, default: Any = "") -> Any:
     for k in keys:
         if k in row:
             val = row.get(k)
-            if val not in (None, "", "null", "N/A", "na", "None", "NULL"):
-                return val
+            if val is None or (isinstance(val, str) and val in _MISSING_VALUES):
+                continue
+            return val
     return default
 
 
 def _yes_no(v: Any) -> str:
     if isinstance(v, bool):
         return "Yes" if v else "No"
-    s = _norm(v).lower()
-    return "Yes" if s in {"yes", "true", "1", "y"} else "No"
+    # Only surrounding whitespace matters for a yes/no token
+    s = v.strip().lower() if isinstance(v, str) else _norm(v).lower()
+    return "Yes" if s in _YES_VALUES else "No"
 
 
 def _to_number_or_blank(x: Any) -> Any:
     try:
         s = str(x).strip()
-        if not s or s.lower() in {"nan", "none", "null"}:
+        if not s or s.lower() in _BLANK_NUMBER_VALUES:
             return ""
         f = float(s.replace(",", ""))
         return int(f) if f.is_integer() else f
@@ -100,6 +110,17 @@ BUCKETS_ORDER = [
 ]
 
 
+# Precomputed leader column keys (no per-row f-strings)
+_NAME_KEYS = tuple(f"Name {i}" for i in range(1, 6))
+_DESIG_KEYS = tuple(f"Designation {i}" for i in range(1, 6))
+_LEADER_KEY_PAIRS = tuple(zip(_NAME_KEYS, _DESIG_KEYS))
+
+# Name 1 / Designation 1 ... Name 5 / Designation 5 (built once, copied per row)
+_EMPTY_NAMES: Dict[str, str] = dict.fromkeys(
+    (k for pair in _LEADER_KEY_PAIRS for k in pair), ""
+)
+
+
 def _flatten_case2_management_to_names(case2_management: Any) -> Dict[str, str]:
     """
     Convert bucket dict -> Name 1..5, Designation 1..5 (strict order).
@@ -109,18 +130,15 @@ def _flatten_case2_management_to_names(case2_management: Any) -> Dict[str, str]:
     - If name exists but designation missing, still fill (designation blank allowed).
     - designation fallback from role.
     """
-    out: Dict[str, str] = {}
-    for i in range(1, 6):
-        out[f"Name {i}"] = ""
-        out[f"Designation {i}"] = ""
+    out: Dict[str, str] = _EMPTY_NAMES.copy()
 
     mgmt = _safe_json_load(case2_management) or {}
     if not isinstance(mgmt, dict):
         return out
 
-    idx = 1
+    idx = 0
     for bucket in BUCKETS_ORDER:
-        if idx > 5:
+        if idx >= 5:
             break
 
         v = mgmt.get(bucket) or {}
@@ -132,8 +150,8 @@ def _flatten_case2_management_to_names(case2_management: Any) -> Dict[str, str]:
 
         # ✅ name-only allowed
         if nm:
-            out[f"Name {idx}"] = nm
-            out[f"Designation {idx}"] = dg
+            out[_NAME_KEYS[idx]] = nm
+            out[_DESIG_KEYS[idx]] = dg
             idx += 1
 
     return out
@@ -144,21 +162,17 @@ def _flatten_case2_leaders_legacy(case2_leaders: Any) -> Dict[str, str]:
     Legacy support: case2_leaders = [{name, role}, ...]
     ✅ Also supports designation key.
     """
-    out: Dict[str, str] = {}
-    for i in range(1, 6):
-        out[f"Name {i}"] = ""
-        out[f"Designation {i}"] = ""
+    out: Dict[str, str] = _EMPTY_NAMES.copy()
 
     leaders = _safe_json_load(case2_leaders) or []
     if not isinstance(leaders, list):
         return out
 
-    for i in range(1, 6):
-        idx = i - 1
-        if idx < len(leaders) and isinstance(leaders[idx], dict):
-            out[f"Name {i}"] = _norm(leaders[idx].get("name", ""))
-            out[f"Designation {i}"] = _norm(
-                leaders[idx].get("role", leaders[idx].get("designation", ""))
+    for (name_key, desig_key), leader in zip(_LEADER_KEY_PAIRS, leaders):
+        if isinstance(leader, dict):
+            out[name_key] = _norm(leader.get("name", ""))
+            out[desig_key] = _norm(
+                leader.get("role", leader.get("designation", ""))
             )
     return out
 
@@ -201,37 +215,37 @@ def _build_excel_row(row: Dict[str, Any]) -> Dict[str, Any]:
     # 2) else if case2_management exists -> flatten buckets
     # 3) else legacy case2_leaders list
     # ---------------------------------------------------------
+    # One pass: normalize the row's own Name/Designation cells once, and
+    # remember whether any of them is set (no second normalize-and-copy loop)
+    flat = {}
     has_flat = False
-    for i in range(1, 6):
-        n = _norm(row.get(f"Name {i}", ""))
-        d = _norm(row.get(f"Designation {i}", ""))
+    for name_key, desig_key in _LEADER_KEY_PAIRS:
+        n = flat[name_key] = _norm(row.get(name_key, ""))
+        d = flat[desig_key] = _norm(row.get(desig_key, ""))
         if n or d:
             has_flat = True
-            break
 
     if has_flat:
-        for i in range(1, 6):
-            out[f"Name {i}"] = _norm(row.get(f"Name {i}", ""))
-            out[f"Designation {i}"] = _norm(row.get(f"Designation {i}", ""))
+        out.update(flat)
     else:
         flat_from_mgmt = _flatten_case2_management_to_names(row.get("case2_management"))
-        if any(flat_from_mgmt.get(f"Name {i}") for i in range(1, 6)):
-            for i in range(1, 6):
-                out[f"Name {i}"] = flat_from_mgmt.get(f"Name {i}", "")
-                out[f"Designation {i}"] = flat_from_mgmt.get(f"Designation {i}", "")
+        if any(flat_from_mgmt.get(k) for k in _NAME_KEYS):
+            for name_key, desig_key in _LEADER_KEY_PAIRS:
+                out[name_key] = flat_from_mgmt.get(name_key, "")
+                out[desig_key] = flat_from_mgmt.get(desig_key, "")
         else:
             flat_legacy = _flatten_case2_leaders_legacy(row.get("case2_leaders"))
-            for i in range(1, 6):
-                out[f"Name {i}"] = flat_legacy.get(f"Name {i}", "")
-                out[f"Designation {i}"] = flat_legacy.get(f"Designation {i}", "")
+            for name_key, desig_key in _LEADER_KEY_PAIRS:
+                out[name_key] = flat_legacy.get(name_key, "")
+                out[desig_key] = flat_legacy.get(desig_key, "")
 
     # Leadership Found:
     lf = _norm(row.get("Leadership Found", ""))
     if lf in {"Yes", "No"}:
         out["Leadership Found"] = lf
     else:
-        # ✅ FIX: if ANY Name i exists -> Yes
-        out["Leadership Found"] = "Yes" if any(_norm(out.get(f"Name {i}", "")) for i in range(1, 6)) else "No"
+        # ✅ FIX: if ANY Name i exists -> Yes (every Name i above is already normalized)
+        out["Leadership Found"] = "Yes" if any(out.get(k) for k in _NAME_KEYS) else "No"
 
     return out
 
@@ -239,66 +253,80 @@ def _build_excel_row(row: Dict[str, Any]) -> Dict[str, Any]:
 # -----------------------------
 # Excel Writer
 # -----------------------------
-def write_case1_excel(rows: List[Dict[str, Any]], out_path: str) -> None:
-    normalized = [_build_excel_row(dict(r)) for r in (rows or [])]
-    df = pd.DataFrame(normalized)
+def write_case1_excel(rows: List[Dict[str, Any]], out_path: str = "") -> bytes:
+    """
+    Build the workbook in memory and return its bytes.
+    If out_path is given, the same bytes are also saved to disk
+    (no write-then-read-back round trip for callers that need both).
 
-    if df.empty:
-        df = pd.DataFrame(columns=FINAL_COLS)
-    else:
-        for col in FINAL_COLS:
-            if col not in df.columns:
-                df[col] = ""
-        df = df[FINAL_COLS]
-
-    with pd.ExcelWriter(out_path, engine="openpyxl") as writer:
-        df.to_excel(writer, index=False, sheet_name="Mining Results")
-        ws = writer.book["Mining Results"]
-
-        ws.freeze_panes = "A2"
-
-        header_fill = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF")
-
-        green_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-        red_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-
-        thin_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
-
-        # Header styling
-        for i, col_name in enumerate(FINAL_COLS, start=1):
-            cell = ws.cell(row=1, column=i)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-        # Column widths
-        wide_cols = {"Company Name", "Website URL", "Source URL", "Contact Email", "Address"}
-        for i, col_name in enumerate(FINAL_COLS, start=1):
-            letter = get_column_letter(i)
-            if col_name in wide_cols:
-                ws.column_dimensions[letter].width = 42
-            elif col_name == "Place ID":
-                ws.column_dimensions[letter].width = 26
-            elif "Name" in col_name or "Designation" in col_name:
-                ws.column_dimensions[letter].width = 30
-            else:
-                ws.column_dimensions[letter].width = 16
-
-        # Borders + wrap + Leadership Found conditional color
-        lf_col = FINAL_COLS.index("Leadership Found") + 1
-        for r in range(2, ws.max_row + 1):
-            for c in range(1, ws.max_column + 1):
-                cell = ws.cell(row=r, column=c)
-                cell.border = thin_border
-                cell.alignment = Alignment(vertical="top", wrap_text=True)
-
-            lf_cell = ws.cell(row=r, column=lf_col)
-            lf_cell.fill = green_fill if str(lf_cell.value).strip() == "Yes" else red_fill
-
-    print(f"✅ Excel Generation Successful: {out_path}")
+    Uses a write-only (streaming) workbook: rows are styled as they are
+    appended, so memory stays flat instead of holding a full cell grid.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Mining Results")
+
+    ws.freeze_panes = "A2"
+
+    header_fill = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFF")
+    header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+
+    green_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+    red_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+
+    thin_border = Border(
+        left=Side(style="thin"),
+        right=Side(style="thin"),
+        top=Side(style="thin"),
+        bottom=Side(style="thin"),
+    )
+    body_alignment = Alignment(vertical="top", wrap_text=True)
+
+    # Column widths (must be set before the first row in write-only mode)
+    wide_cols = {"Company Name", "Website URL", "Source URL", "Contact Email", "Address"}
+    for i, col_name in enumerate(FINAL_COLS, start=1):
+        letter = get_column_letter(i)
+        if col_name in wide_cols:
+            ws.column_dimensions[letter].width = 42
+        elif col_name == "Place ID":
+            ws.column_dimensions[letter].width = 26
+        elif "Name" in col_name or "Designation" in col_name:
+            ws.column_dimensions[letter].width = 30
+        else:
+            ws.column_dimensions[letter].width = 16
+
+    # Header styling
+    header = []
+    for col_name in FINAL_COLS:
+        cell = WriteOnlyCell(ws, value=col_name)
+        cell.fill = header_fill
+        cell.font = header_font
+        cell.alignment = header_alignment
+        header.append(cell)
+    ws.append(header)
+
+    # Borders + wrap + Leadership Found conditional color
+    for r in rows or []:
+        out = _build_excel_row(dict(r))
+        cells = []
+        for col_name in FINAL_COLS:
+            val = out.get(col_name, "")
+            # Blank strings become empty cells (same as the old DataFrame export)
+            cell = WriteOnlyCell(ws, value=None if val == "" else val)
+            cell.border = thin_border
+            cell.alignment = body_alignment
+            if col_name == "Leadership Found":
+                cell.fill = green_fill if str(val).strip() == "Yes" else red_fill
+            cells.append(cell)
+        ws.append(cells)
+
+    buf = io.BytesIO()
+    wb.save(buf)
+
+    data = buf.getvalue()
+    if out_path:
+        with open(out_path, "wb") as f:
+            f.write(data)
+        print(f"✅ Excel Generation Successful: {out_path}")
+
+    return data
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Iterable, Iterator
 import re
 import json
 
@@ -8,9 +8,12 @@ import json
 # -----------------------------
 # Normalization Helpers
 # -----------------------------
+_WS_RE = re.compile(r"\s+")
+
+
 def _norm(s: Any) -> str:
     s = "" if s is None else str(s)
-    return re.sub(r"\s+", " ", s.strip())
+    return _WS_RE.sub(" ", s.strip())
 
 
 def _safe_json(x: Any) -> Any:
@@ -36,12 +39,18 @@ BUCKETS_ORDER = [
 ]
 
 
+# Precomputed leader column keys (no per-row f-strings)
+_NAME_KEYS = tuple(f"Name {i}" for i in range(1, 6))
+_DESIG_KEYS = tuple(f"Designation {i}" for i in range(1, 6))
+
+# Name 1 / Designation 1 ... Name 5 / Designation 5 (built once, copied per row)
+_EMPTY_NAMES: Dict[str, str] = dict.fromkeys(
+    (k for pair in zip(_NAME_KEYS, _DESIG_KEYS) for k in pair), ""
+)
+
+
 def _empty_names() -> Dict[str, str]:
-    out: Dict[str, str] = {}
-    for i in range(1, 6):
-        out[f"Name {i}"] = ""
-        out[f"Designation {i}"] = ""
-    return out
+    return _EMPTY_NAMES.copy()
 
 
 def _flatten_case2_management(case2_management: Dict[str, Dict[str, str]]) -> Dict[str, str]:
@@ -51,17 +60,17 @@ def _flatten_case2_management(case2_management: Dict[str, Dict[str, str]]) -> Di
     Order strictly follows BUCKETS_ORDER
     """
     out = _empty_names()
-    idx = 1
+    idx = 0
 
     for bucket in BUCKETS_ORDER:
-        if idx > 5:
+        if idx >= 5:
             break
         data = case2_management.get(bucket) or {}
         name = _norm(data.get("name", ""))
         role = _norm(data.get("designation", ""))
         if name and role:
-            out[f"Name {idx}"] = name
-            out[f"Designation {idx}"] = role
+            out[_NAME_KEYS[idx]] = name
+            out[_DESIG_KEYS[idx]] = role
             idx += 1
 
     return out
@@ -92,86 +101,114 @@ def _dedupe_key(place_id: str, company: str, address: str) -> str:
 # -----------------------------
 # MAIN MINER
 # -----------------------------
-def mine_case1_records(raw_records: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
-    cleaned: List[Dict[str, Any]] = []
+def mine_case1_record(r: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """
+    Clean ONE raw record -> (dedupe_key, row).
+    Pure + top-level (picklable), so it can be mapped over records by any executor.
+    """
+    company = _norm(
+        r.get("Company Name")
+        or (r.get("displayName") or {}).get("text")
+        or r.get("name")
+    )
+
+    website = _norm(
+        r.get("Website URL")
+        or r.get("websiteUri")
+        or r.get("website")
+    )
+
+    place_id = _norm(
+        r.get("Place ID")
+        or r.get("google_place_id")
+        or r.get("place_id")
+        or r.get("id")
+    )
+
+    address = _norm(r.get("Address") or r.get("formattedAddress") or "")
+
+    key = _dedupe_key(place_id=place_id, company=company, address=address)
+
+    # -----------------------------
+    # Case-2 handling
+    # -----------------------------
+    raw_case2 = (
+        r.get("case2_management")
+        or (r.get("case2_payload") or {}).get("case2_management")
+    )
+
+    case2_mgmt = _safe_json(raw_case2) or {}
+    if not isinstance(case2_mgmt, dict):
+        case2_mgmt = {}
+
+    flat_leaders = _flatten_case2_management(case2_mgmt)
+
+    row: Dict[str, Any] = {
+        "Company Name": company or "Unknown",
+        "Industry": _norm(r.get("Industry") or r.get("primaryType") or "Business"),
+        "Google Rating": r.get("Google Rating") or r.get("rating"),
+        "Rating Count": r.get("Reviews") or r.get("userRatingCount"),
+        "Has Website": "Yes" if website else "No",
+        "Website URL": website,
+        "Contact Phone": _norm(
+            r.get("Contact Phone")
+            or r.get("internationalPhoneNumber")
+            or r.get("nationalPhoneNumber")
+            or ""
+        ),
+        "Contact Email": _norm(r.get("Contact Email") or r.get("email") or ""),
+        "Address": address,
+        "Place ID": place_id,
+        "Source Name": _norm(r.get("Source Name") or "Google Places"),
+        "Source URL": _norm(r.get("Source URL") or r.get("googleMapsUri") or ""),
+    }
+
+    # Inject flattened leaders
+    row.update(flat_leaders)
+    row["Leadership Found"] = _leadership_found(flat_leaders)
+
+    # Keep for DB/debug
+    row["case2_management"] = case2_mgmt
+
+    return key, row
+
+
+def iter_case1_records(raw_records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming miner: yields one cleaned (deduped) row per raw record, so
+    callers can start Case-2 work on early rows while later ones are mined.
+    """
     seen: set[str] = set()
 
     for r in raw_records or []:
-        company = _norm(
-            r.get("Company Name")
-            or (r.get("displayName") or {}).get("text")
-            or r.get("name")
-        )
-
-        website = _norm(
-            r.get("Website URL")
-            or r.get("websiteUri")
-            or r.get("website")
-        )
-
-        place_id = _norm(
-            r.get("Place ID")
-            or r.get("google_place_id")
-            or r.get("place_id")
-            or r.get("id")
-        )
-
-        address = _norm(r.get("Address") or r.get("formattedAddress") or "")
+        key, row = mine_case1_record(r)
 
         # ✅ DEDUPE (critical for 150 cap accuracy)
-        key = _dedupe_key(place_id=place_id, company=company, address=address)
         if key and key in seen:
             continue
         if key:
             seen.add(key)
 
-        # -----------------------------
-        # Case-2 handling
-        # -----------------------------
-        raw_case2 = (
-            r.get("case2_management")
-            or (r.get("case2_payload") or {}).get("case2_management")
-        )
-
-        case2_mgmt = _safe_json(raw_case2) or {}
-        if not isinstance(case2_mgmt, dict):
-            case2_mgmt = {}
-
-        flat_leaders = _flatten_case2_management(case2_mgmt)
-
-        row: Dict[str, Any] = {
-            "Company Name": company or "Unknown",
-            "Industry": _norm(r.get("Industry") or r.get("primaryType") or "Business"),
-            "Google Rating": r.get("Google Rating") or r.get("rating"),
-            "Rating Count": r.get("Reviews") or r.get("userRatingCount"),
-            "Has Website": "Yes" if website else "No",
-            "Website URL": website,
-            "Contact Phone": _norm(
-                r.get("Contact Phone")
-                or r.get("internationalPhoneNumber")
-                or r.get("nationalPhoneNumber")
-                or ""
-            ),
-            "Contact Email": _norm(r.get("Contact Email") or r.get("email") or ""),
-            "Address": address,
-            "Place ID": place_id,
-            "Source Name": _norm(r.get("Source Name") or "Google Places"),
-            "Source URL": _norm(r.get("Source URL") or r.get("googleMapsUri") or ""),
-        }
-
-        # Inject flattened leaders
-        row.update(flat_leaders)
-        row["Leadership Found"] = _leadership_found(flat_leaders)
-
-        # Keep for DB/debug
-        row["case2_management"] = case2_mgmt
+        yield row
+
+
+def mine_case1_records(raw_records: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    cleaned: List[Dict[str, Any]] = []
+    with_website = 0
+    with_leadership = 0
 
+    # Single pass: collect rows and count stats together
+    for row in iter_case1_records(raw_records):
         cleaned.append(row)
+        if row["Website URL"]:
+            with_website += 1
+        if row["Leadership Found"] == "Yes":
+            with_leadership += 1
 
     stats = {
         "total": len(cleaned),
-        "with_website": sum(1 for x in cleaned if (x.get("Website URL") or "").strip()),
-        "with_leadership": sum(1 for x in cleaned if x.get("Leadership Found") == "Yes"),
+        "with_website": with_website,
+        "with_leadership": with_leadership,
         "deduped_out": (len(raw_records or []) - len(cleaned)),
     }
 
@@ -16,6 +16,19 @@ try:
 except Exception:
     sync_playwright = None  # type: ignore
 
+try:
+    from backend.config import RAW_JSON_PRETTY
+except ImportError:
+    RAW_JSON_PRETTY = False
+
+# Optional fast JSON (raw dumps can be large); stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
 
 # =========================================================
 # ======================= CASE 1 ==========================
@@ -306,17 +319,29 @@ def scrape_google_places_expand(
         variants = [query]
 
     collected: List[Dict[str, Any]] = []
+    seen_ids: set[str] = set()
     last_gains: List[int] = []
 
     def _unique_count() -> int:
         return len(collected)
 
+    def _add_unique(items: List[Dict[str, Any]]) -> None:
+        """Incremental dedupe by Places id; stops as soon as max_results is reached."""
+        for it in items:
+            if len(collected) >= max_results:
+                return
+            pid = (it or {}).get("id") or ""
+            if pid:
+                if pid in seen_ids:
+                    continue
+                seen_ids.add(pid)
+            collected.append(it)
+
     # Start with user's intent; add variants only if stuck.
     active_variants: List[str] = [variants[0]]
     fallback_variants: List[str] = variants[1:]
 
     for idx_ctx, ctx in enumerate(contexts):
-        collected = _dedupe_places_by_id(collected)
         if _unique_count() >= max_results:
             break
 
@@ -335,12 +360,18 @@ def scrape_google_places_expand(
             except Exception:
                 res = []
             if res:
-                collected.extend(res)
-                collected = _dedupe_places_by_id(collected)
+                _add_unique(res)
+
+            # ✅ Early exit: target reached, no more calls (or delays) needed
+            if _unique_count() >= max_results:
+                break
 
             # Small delay between variant calls (rate-limit friendly)
             time.sleep(0.25)
 
+        if _unique_count() >= max_results:
+            break
+
         after = _unique_count()
         gain = max(0, after - before)
         last_gains.append(gain)
@@ -389,8 +420,7 @@ def scrape_case1_to_raw(
     )
 
     out_path = os.path.join(RAW_DIR, f"raw_{run_id}.json")
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(raw, f, ensure_ascii=False, indent=2)
+    _write_raw_json(out_path, raw)
 
     return raw, out_path
 
@@ -417,6 +447,20 @@ ROLE_KEYWORDS = [
 NAME_RE = re.compile(r"^[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+){1,4}$", re.ASCII)
 
 
+def _write_raw_json(out_path: str, data: Any) -> None:
+    """Compact by default (half the bytes/CPU of indent=2); RAW_JSON_PRETTY=true to indent."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if RAW_JSON_PRETTY else 0)
+        with open(out_path, "wb", buffering=1 << 20) as f:
+            f.write(orjson.dumps(data, option=option))
+        return
+    with open(out_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        if RAW_JSON_PRETTY:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        else:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+
 def _clean_url(u: str) -> str:
     u = (u or "").strip()
     if not u:
@@ -534,12 +578,12 @@ def scrape_leadership_smart(website: str) -> List[Dict[str, str]]:
     if not website:
         return []
 
-    start = time.time()
+    start = time.monotonic()
     pages = _discover_pages(website)
     seen = set()
 
     for url in pages:
-        if time.time() - start > TIMEOUT_SECS:
+        if time.monotonic() - start > TIMEOUT_SECS:
             break
         if url in seen:
             continue
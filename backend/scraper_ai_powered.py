@@ -4,11 +4,13 @@ scraper_ai_powered.py - AI SCRAPER WITH COMPLETE AUDIT SYSTEM
 """
 from __future__ import annotations
 
+import heapq
 import json
 import re
 import time
 import random
 from dataclasses import dataclass, asdict
+from operator import attrgetter, itemgetter
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 from datetime import datetime
@@ -58,8 +60,30 @@ LEADERSHIP_KEYWORDS = [
     'our-people', 'meet', 'key', 'senior'
 ]
 
+# Optional Aho-Corasick automaton over LEADERSHIP_KEYWORDS: one C pass over a
+# link's text+href yields every keyword hit (instead of ~24 substring scans twice)
+try:
+    import ahocorasick
+
+    _LINK_AUTOMATON = ahocorasick.Automaton()
+    for _kw in LEADERSHIP_KEYWORDS:
+        _LINK_AUTOMATON.add_word(_kw, _kw)
+    _LINK_AUTOMATON.make_automaton()
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    _LINK_AUTOMATON = None
+    AHOCORASICK_AVAILABLE = False
+
+
+def _link_keyword_score(combined: str) -> int:
+    """Number of distinct LEADERSHIP_KEYWORDS found in combined (0 = not a leadership link)."""
+    if _LINK_AUTOMATON is not None:
+        return len({kw for _, kw in _LINK_AUTOMATON.iter(combined)})
+    return sum(1 for kw in LEADERSHIP_KEYWORDS if kw in combined)
+
 # Data Structures
-@dataclass
+# slots: no per-instance __dict__ (many candidates per crawl)
+@dataclass(slots=True)
 class LeaderCandidate:
     name: str
     role: str
@@ -70,7 +94,8 @@ class LeaderCandidate:
 
 # Helpers
 def _norm(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    # split()/join collapses whitespace runs in C (no regex per call)
+    return " ".join((s or "").split())
 
 def _ensure_url(u: str) -> str:
     u = (u or "").strip()
@@ -86,18 +111,23 @@ def _host(u: str) -> str:
     except:
         return ""
 
+# (category, pattern) in priority order, matched on the lowercased role: first match wins
+_ROLE_CATEGORY_RULES: Tuple[Tuple[str, re.Pattern], ...] = tuple(
+    (category, re.compile(pattern)) for category, pattern in (
+        ("Executive Leadership", r"\b(ceo|chief executive|founder|managing director|chairman|president)\b"),
+        ("Technology / Operations", r"\b(coo|cto|chief operating|chief technology)\b"),
+        ("Finance / Administration", r"\b(cfo|chief financial)\b"),
+        ("Business Development / Growth", r"\b(cro|chief revenue|business development|sales)\b"),
+        ("Marketing / Branding", r"\b(cmo|chief marketing)\b"),
+    )
+)
+
+
 def _categorize_role(role: str) -> str:
     r = role.lower()
-    if re.search(r"\b(ceo|chief executive|founder|managing director|chairman|president)\b", r):
-        return "Executive Leadership"
-    if re.search(r"\b(coo|cto|chief operating|chief technology)\b", r):
-        return "Technology / Operations"
-    if re.search(r"\b(cfo|chief financial)\b", r):
-        return "Finance / Administration"
-    if re.search(r"\b(cro|chief revenue|business development|sales)\b", r):
-        return "Business Development / Growth"
-    if re.search(r"\b(cmo|chief marketing)\b", r):
-        return "Marketing / Branding"
+    for category, pattern in _ROLE_CATEGORY_RULES:
+        if pattern.search(r):
+            return category
     return "Executive Leadership"
 
 # AI Selenium Fetcher
@@ -214,17 +244,17 @@ class AISeleniumFetcher:
             
             combined = f"{text} {href}".lower()
             
-            if any(keyword in combined for keyword in LEADERSHIP_KEYWORDS):
+            score = _link_keyword_score(combined)
+            if score:
                 if abs_url not in seen_urls:
                     seen_urls.add(abs_url)
                     leadership_links.append({
                         'url': abs_url,
                         'text': _norm(a.get_text()),
-                        'score': sum(1 for kw in LEADERSHIP_KEYWORDS if kw in combined)
+                        'score': score
                     })
         
-        leadership_links.sort(key=lambda x: x['score'], reverse=True)
-        top_links = leadership_links[:MAX_PAGES_TO_CHECK]
+        top_links = heapq.nlargest(MAX_PAGES_TO_CHECK, leadership_links, key=itemgetter('score'))
         
         print(f"✅ Found {len(top_links)} leadership-related links")
         for link in top_links:
@@ -240,6 +270,16 @@ class AISeleniumFetcher:
                 pass
 
 # Content Analysis
+# Patterns compiled once at import (not on every page analysed / extracted)
+_AUDIT_NAME_RE = re.compile(r'\b[A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?\b')
+_AUDIT_EXEC_KEYWORDS = ('ceo', 'founder', 'director', 'president', 'chief')
+_AUDIT_ROLE_RE = re.compile(r'\b(ceo|coo|cto|cfo|founder|director|president)\b', re.I)
+_EXEC_RE = re.compile(
+    r"\b(ceo|coo|cto|cfo|cmo|chief|president|director|founder|executive|vp|vice president)\b",
+    re.I
+)
+
+
 def analyze_content(html: str) -> Dict[str, Any]:
     """Analyze for audit"""
     soup = BeautifulSoup(html, 'lxml')
@@ -249,16 +289,14 @@ def analyze_content(html: str) -> Dict[str, Any]:
     text = soup.get_text()
     
     # Names
-    name_pattern = re.compile(r'\b[A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?\b')
-    names = list(set(name_pattern.findall(text)))
+    names = list(set(_AUDIT_NAME_RE.findall(text)))
     
     # Keywords
-    exec_keywords = ['ceo', 'founder', 'director', 'president', 'chief']
-    found = [kw for kw in exec_keywords if kw in text.lower()]
+    text_low = text.lower()
+    found = [kw for kw in _AUDIT_EXEC_KEYWORDS if kw in text_low]
     
     # Roles
-    role_pattern = re.compile(r'\b(ceo|coo|cto|cfo|founder|director|president)\b', re.I)
-    roles = len(role_pattern.findall(text))
+    roles = len(_AUDIT_ROLE_RE.findall(text))
     
     return {
         "names": len(names),
@@ -276,11 +314,7 @@ def extract_leaders_enhanced(html: str, url: str) -> List[LeaderCandidate]:
     
     leaders = []
     seen = set()
-    
-    exec_pattern = re.compile(
-        r"\b(ceo|coo|cto|cfo|cmo|chief|president|director|founder|executive|vp|vice president)\b",
-        re.I
-    )
+    exec_pattern = _EXEC_RE
     
     # Strategy 1: Team member cards (XDE Studios style)
     # Look for div/section containing name + role together
@@ -446,8 +480,7 @@ def scrape_with_ai(company_url: str) -> Dict[str, Any]:
                 seen.add(key)
                 final.append(l)
         
-        final.sort(key=lambda x: x.confidence, reverse=True)
-        final = final[:5]
+        final = heapq.nlargest(5, final, key=attrgetter('confidence'))
         
         # Generate audit report
         if len(final) > 0:
@@ -4,11 +4,13 @@ Strict validation + Advanced anti-detection techniques
 """
 from __future__ import annotations
 
+import heapq
 import json
 import re
 import time
 import random
 from dataclasses import dataclass, asdict
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse
 
@@ -26,12 +28,12 @@ try:
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
-    print("⚠️ Selenium not available - bot bypass limited")
 
 try:
     from backend.config import (
         HEADERS, REQUEST_TIMEOUT, USER_AGENTS_POOL,
-        AGENT_RETRY_DELAY_MIN, AGENT_RETRY_DELAY_MAX
+        AGENT_RETRY_DELAY_MIN, AGENT_RETRY_DELAY_MAX,
+        DEBUG_MODE,
     )
 except ImportError:
     try:
@@ -42,12 +44,18 @@ except ImportError:
         ]
         AGENT_RETRY_DELAY_MIN = 2
         AGENT_RETRY_DELAY_MAX = 5
+        DEBUG_MODE = False
     except ImportError:
         HEADERS = {}
         REQUEST_TIMEOUT = 25
         USER_AGENTS_POOL = ["Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"]
         AGENT_RETRY_DELAY_MIN = 2
         AGENT_RETRY_DELAY_MAX = 5
+        DEBUG_MODE = False
+
+# Import-time notice, behind DEBUG_MODE like the other console output
+if not SELENIUM_AVAILABLE and DEBUG_MODE:
+    print("⚠️ Selenium not available - bot bypass limited")
 
 try:
     from db import get_conn, save_leaders_to_db
@@ -101,16 +109,38 @@ BAD_KEYWORDS = {
     ".com", ".in", ".org", ".net", "www", "http"
 }
 
+# Combined, precompiled reject/detect patterns: one case-insensitive C scan
+# instead of lower()-ing the input and looping over substrings
+_BAD_NAME_RE = re.compile(
+    "|".join(map(re.escape, [
+        "tally", "software", "solution", "dealer", "pvt", "ltd", "inc",
+        "www", "http", "privacy", "terms", "cookie", "login", "signup",
+    ])),
+    re.I,
+)
+_BAD_ROLE_RE = re.compile("tally|prime|dealer|solution", re.I)
+_NAME_TITLE_RE = re.compile(r"^(mr|mrs|ms|dr|prof|sir)\.?\s+", re.I)
+_VOWEL_RE = re.compile(r"[aeiouAEIOU]")
+_NAME_PUNCT_OK = frozenset(" -.'")
+_CAPTCHA_RE = re.compile("|".join(map(re.escape, CAPTCHA_DETECT_KEYWORDS)), re.I)
+_ACCESS_DENIED_RE = re.compile("access denied", re.I)
+
 NEGATIVE_CONTEXT = [
     "testimonial", "client", "customer", "review", "award", "recognition",
     "press", "product", "service", "solution", "dealer", "partner"
 ]
+_NEGATIVE_CONTEXT_RE = re.compile("|".join(map(re.escape, NEGATIVE_CONTEXT)), re.I)
+
+# Containers worth walking for leader cards (any hint anywhere in the text)
+CARD_CONTAINER_HINTS = ["ceo", "founder", "director", "executive", "officer"]
+_CARD_CONTAINER_RE = re.compile("|".join(map(re.escape, CARD_CONTAINER_HINTS)), re.I)
 
 
 # =============================================================================
 # Data Structures
 # =============================================================================
-@dataclass
+# slots: no per-instance __dict__ (many candidates per crawl)
+@dataclass(slots=True)
 class LeaderCandidate:
     name: str
     role: str
@@ -121,11 +151,16 @@ class LeaderCandidate:
     category: str = "Executive Leadership"
 
 
+# Sort key for candidate ranking (C-level getter, no per-item lambda)
+_BY_CONFIDENCE = attrgetter("confidence")
+
+
 # =============================================================================
 # NUCLEAR Validation
 # =============================================================================
 def _norm(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    # split()/join collapses whitespace runs in C (no regex per call)
+    return " ".join((s or "").split())
 
 try:
     from db import _ensure_url as db_ensure_url
@@ -161,24 +196,25 @@ def _canonicalize(url: str) -> str:
 
 def _looks_like_person_name(name: str) -> bool:
     """RELAXED MODE: Less strict name validation for better extraction"""
+    # _norm only shrinks a string, so short raw input can be rejected unnormalized
+    if not name or len(name) < 5:
+        return False
     name = _norm(name)
     
     # Basic length check (more lenient)
     if not (5 <= len(name) <= 60):
         return False
     
+    # 2+ words needs a space (cheap C scan before any regex work)
+    if " " not in name:
+        return False
+    
     # Remove titles
-    name = re.sub(r"^(mr|mrs|ms|dr|prof|sir)\.?\s+", "", name, flags=re.I)
-    low = name.lower()
+    name = _NAME_TITLE_RE.sub("", name)
     
     # Only reject obvious non-names (reduced list)
-    bad_keywords_strict = [
-        "tally", "software", "solution", "dealer", "pvt", "ltd", "inc", 
-        "www", "http", "privacy", "terms", "cookie", "login", "signup"
-    ]
-    for bad in bad_keywords_strict:
-        if bad in low:
-            return False
+    if _BAD_NAME_RE.search(name):
+        return False
     
     # Must have 2-5 words (relaxed)
     words = [w for w in name.split() if len(w) > 1]
@@ -190,18 +226,21 @@ def _looks_like_person_name(name: str) -> bool:
         return False
     
     # Should have vowels (real names have vowels)
-    if not re.search(r"[aeiouAEIOU]", name):
-        return False
-    
-    # No excessive numbers (allow some)
-    digit_count = sum(1 for c in name if c.isdigit())
-    if digit_count > 2:
+    if not _VOWEL_RE.search(name):
         return False
     
-    # Reject if too many special characters
-    special_count = sum(1 for c in name if not c.isalnum() and c not in [' ', '-', '.', "'"])
-    if special_count > 2:
-        return False
+    # No excessive numbers (allow some) / too many special characters:
+    # one pass counting both, bailing out as soon as either passes 2
+    digit_count = special_count = 0
+    for c in name:
+        if c.isdigit():
+            digit_count += 1
+            if digit_count > 2:
+                return False
+        elif not c.isalnum() and c not in _NAME_PUNCT_OK:
+            special_count += 1
+            if special_count > 2:
+                return False
     
     return True
 
@@ -214,17 +253,13 @@ def _looks_like_role(role: str) -> bool:
     if not (5 <= len(role) <= 100):
         return False
     
-    low = role.lower()
-    
     # Must match executive pattern
     if not EXEC_RE.search(role):
         return False
     
     # Reject obvious bad keywords (reduced)
-    bad_keywords_roles = ["tally", "prime", "dealer", "solution"]
-    for bad in bad_keywords_roles:
-        if bad in low:
-            return False
+    if _BAD_ROLE_RE.search(role):
+        return False
     
     # Allow more punctuation
     if "…" in role or role.count("...") > 1:
@@ -238,21 +273,65 @@ def _looks_like_role(role: str) -> bool:
     return True
 
 
+# (category, pattern) in priority order, matched on the lowercased role: first match wins
+_ROLE_CATEGORY_RULES: Tuple[Tuple[str, re.Pattern], ...] = tuple(
+    (category, re.compile(pattern)) for category, pattern in (
+        ("Executive Leadership", r"\b(ceo|chief executive|founder|managing director|chairman|president)\b"),
+        ("Technology / Operations", r"\b(coo|cto|chief operating|chief technology)\b"),
+        ("Finance / Administration", r"\b(cfo|chief financial)\b"),
+        ("Business Development / Growth", r"\b(cro|chief revenue|business development|sales)\b"),
+        ("Marketing / Branding", r"\b(cmo|chief marketing)\b"),
+    )
+)
+
+
 def _categorize_role(role: str) -> str:
     r = role.lower()
-    if re.search(r"\b(ceo|chief executive|founder|managing director|chairman|president)\b", r):
-        return "Executive Leadership"
-    if re.search(r"\b(coo|cto|chief operating|chief technology)\b", r):
-        return "Technology / Operations"
-    if re.search(r"\b(cfo|chief financial)\b", r):
-        return "Finance / Administration"
-    if re.search(r"\b(cro|chief revenue|business development|sales)\b", r):
-        return "Business Development / Growth"
-    if re.search(r"\b(cmo|chief marketing)\b", r):
-        return "Marketing / Branding"
+    for category, pattern in _ROLE_CATEGORY_RULES:
+        if pattern.search(r):
+            return category
     return "Executive Leadership"
 
 
+# Role seniority bonus for _score_candidate: first tier with a hit wins
+_ROLE_BONUS_TIERS: Tuple[Tuple[float, Tuple[str, ...]], ...] = (
+    (0.10, ("ceo", "founder", "chairman", "president")),
+    (0.06, ("cto", "cfo", "coo", "cro", "cmo")),
+)
+
+# Optional Aho-Corasick automaton: every tier keyword found in one C pass over
+# the role; the lowest tier index among hits keeps the tier-order semantics.
+try:
+    import ahocorasick
+
+    _BONUS_AUTOMATON = ahocorasick.Automaton()
+    for _i, (_bonus, _words) in enumerate(_ROLE_BONUS_TIERS):
+        for _w in _words:
+            if _w not in _BONUS_AUTOMATON:
+                _BONUS_AUTOMATON.add_word(_w, _i)
+    _BONUS_AUTOMATON.make_automaton()
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    _BONUS_AUTOMATON = None
+    AHOCORASICK_AVAILABLE = False
+
+
+def _role_bonus(role_low: str) -> float:
+    if _BONUS_AUTOMATON is not None:
+        best = len(_ROLE_BONUS_TIERS)
+        for _, i in _BONUS_AUTOMATON.iter(role_low):
+            if i < best:
+                best = i
+                if i == 0:
+                    break
+        return _ROLE_BONUS_TIERS[best][0] if best < len(_ROLE_BONUS_TIERS) else 0.0
+
+    for tier_bonus, words in _ROLE_BONUS_TIERS:
+        if any(word in role_low for word in words):
+            return tier_bonus
+    return 0.0
+
+
 def _score_candidate(name: str, role: str, bonus: float = 0.0) -> float:
     """Scoring with strict validation"""
     s = 0.0
@@ -267,27 +346,25 @@ def _score_candidate(name: str, role: str, bonus: float = 0.0) -> float:
     
     s += 0.40
     
-    role_low = role.lower()
-    if any(word in role_low for word in ["ceo", "founder", "chairman", "president"]):
-        s += 0.10
-    elif any(word in role_low for word in ["cto", "cfo", "coo", "cro", "cmo"]):
-        s += 0.06
+    s += _role_bonus(role.lower())
     
     return max(0.0, min(1.0, s + bonus))
 
 
 def is_blocked(html: str) -> bool:
     """Detect if page is blocked/CAPTCHA"""
-    if not html or len(html) < 300:
+    n = len(html or "")
+    if n < 300:
         return True
-    h = html.lower()
+    # Both signals only count on short pages: big pages skip the scan entirely
+    if n >= 5000:
+        return False
     
-    for keyword in CAPTCHA_DETECT_KEYWORDS:
-        if keyword in h:
-            if len(html) < 5000:
-                return True
+    # (covers "verify you are human" too -- it is a CAPTCHA keyword)
+    if _CAPTCHA_RE.search(html):
+        return True
     
-    if any(sig in h for sig in ["access denied", "verify you are human"]) and len(html) < 2000:
+    if n < 2000 and _ACCESS_DENIED_RE.search(html):
         return True
     
     return False
@@ -384,28 +461,30 @@ class SeleniumFetcher:
 class RequestsFetcher:
     """HTTP fetcher with basic bot bypass"""
     
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, session: Optional[requests.Session] = None):
+        # Shared session (if given) keeps sockets alive across companies
+        self.session = session or requests.Session()
+        self.headers: Dict[str, str] = {}
         self._update_headers()
 
     def _update_headers(self):
-        """Rotate User-Agent"""
+        """Rotate User-Agent (per request, never mutates a shared session)"""
         ua = random.choice(USER_AGENTS_POOL)
-        self.session.headers.update({
+        self.headers = {
             "User-Agent": ua,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.9",
             "DNT": "1",
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",
-        })
+        }
 
     def get(self, url: str) -> Tuple[Optional[str], str, int]:
         try:
             self._update_headers()
             time.sleep(random.uniform(0.5, 1.5))
             
-            r = self.session.get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
+            r = self.session.get(url, headers=self.headers, timeout=REQUEST_TIMEOUT, allow_redirects=True)
             
             if r.status_code >= 400:
                 return None, "error", r.status_code
@@ -431,8 +510,8 @@ class RequestsFetcher:
 class SmartFetcher:
     """Intelligent fetcher: requests first, Selenium fallback"""
     
-    def __init__(self):
-        self.requests_fetcher = RequestsFetcher()
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.requests_fetcher = RequestsFetcher(session=session)
         self.selenium_fetcher = None
         self.selenium_active = False
     
@@ -447,7 +526,8 @@ class SmartFetcher:
             return html, status, code
         
         if status == "blocked" and USE_SELENIUM_FALLBACK and SELENIUM_AVAILABLE:
-            print(f"🤖 Blocked detected, switching to Selenium for: {url}")
+            if DEBUG_MODE:
+                print(f"🤖 Blocked detected, switching to Selenium for: {url}")
             self.selenium_active = True
             return self._get_selenium(url)
         
@@ -573,9 +653,7 @@ def extract_cards(soup, leaders: list, seen: set, url: str):
     containers = soup.find_all(["section", "div", "main", "article"], limit=40)
     
     for container in containers:
-        txt = container.get_text(" ", strip=True).lower()
-        
-        if not any(kw in txt for kw in ["ceo", "founder", "director", "executive", "officer"]):
+        if not _CARD_CONTAINER_RE.search(container.get_text(" ", strip=True)):
             continue
         
         cards = container.find_all(["div", "li", "article"], limit=100)
@@ -586,7 +664,7 @@ def extract_cards(soup, leaders: list, seen: set, url: str):
             if len(block_text) < 20 or len(block_text) > 1000:
                 continue
             
-            if any(neg in block_text.lower() for neg in NEGATIVE_CONTEXT):
+            if _NEGATIVE_CONTEXT_RE.search(block_text):
                 continue
             
             name = ""
@@ -649,8 +727,9 @@ def extract_lists(soup, leaders: list, seen: set, url: str):
             if "-" in text or ":" in text:
                 parts = re.split(r"[-:]", text, maxsplit=1)
                 if len(parts) == 2:
-                    name = _norm(parts[0])
-                    role = _norm(parts[1])
+                    # text is already normalized -> halves only need a strip
+                    name = parts[0].strip()
+                    role = parts[1].strip()
                     
                     if _looks_like_person_name(name) and _looks_like_role(role):
                         key = (name.lower(), role.lower())
@@ -665,15 +744,10 @@ def extract_lists(soup, leaders: list, seen: set, url: str):
 
 def extract_text_pairs(soup, leaders: list, seen: set, url: str):
     text = soup.get_text("\n", strip=True)
-    lines = [l.strip() for l in text.split("\n") if l.strip()]
+    # Normalize every line once (each line is used as both line1 and line2)
+    lines = [l for l in map(_norm, text.split("\n")) if l]
     
-    for i in range(len(lines) - 1):
-        line1 = _norm(lines[i])
-        line2 = _norm(lines[i + 1])
-        
-        if not line1 or not line2:
-            continue
-        
+    for line1, line2 in zip(lines, lines[1:]):
         if _looks_like_person_name(line1) and _looks_like_role(line2):
             key = (line1.lower(), line2.lower())
             if key not in seen:
@@ -703,15 +777,17 @@ def extract_leaders_improved(html: str, source_url: str) -> List[LeaderCandidate
     if len(leaders) < 2:
         extract_text_pairs(soup, leaders, seen, source_url)
     
-    leaders.sort(key=lambda x: x.confidence, reverse=True)
-    return leaders[:MAX_LEADERS]
+    # Top-N by confidence without sorting the whole candidate list
+    # (nlargest keeps sort's tie order)
+    return heapq.nlargest(MAX_LEADERS, leaders, key=_BY_CONFIDENCE)
 
 
 # =============================================================================
 # MAIN SCRAPER
 # =============================================================================
 def scrape_company_leadership(company_url: str, respect_robots: bool = True, 
-                              save_to_db: bool = False) -> Dict[str, Any]:
+                              save_to_db: bool = False,
+                              session: Optional[requests.Session] = None) -> Dict[str, Any]:
     """NUCLEAR MODE Leadership Scraper + BOT DETECTION BYPASS"""
     
     company_url = _ensure_url(company_url)
@@ -719,7 +795,7 @@ def scrape_company_leadership(company_url: str, respect_robots: bool = True,
     if not company_url:
         return {"error": "Invalid URL", "success": False, "all_leaders": []}
     
-    fetcher = SmartFetcher()
+    fetcher = SmartFetcher(session=session)
     
     try:
         urls = discover_urls_smart(company_url, fetcher)
@@ -747,16 +823,11 @@ def scrape_company_leadership(company_url: str, respect_robots: bool = True,
             else:
                 stats["failed"] += 1
         
-        seen = set()
-        final = []
+        # Candidates are normalized at extraction; first (name, role) wins
+        final_by_key = {}
         for l in all_leaders:
-            key = (l.name.lower(), l.role.lower())
-            if key not in seen:
-                seen.add(key)
-                final.append(l)
-        
-        final.sort(key=lambda x: x.confidence, reverse=True)
-        final = final[:MAX_LEADERS]
+            final_by_key.setdefault((l.name.lower(), l.role.lower()), l)
+        final = heapq.nlargest(MAX_LEADERS, final_by_key.values(), key=_BY_CONFIDENCE)
         
         by_category = {}
         for l in final: